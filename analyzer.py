@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from typing import Dict, List
+import json
 import statistics
 from collections import Counter
 import threading
@@ -28,25 +29,35 @@ class SocialMediaAnalyzer:
         platform = platform_data['platform'].lower()
 
         # Calculate engagement metrics based on platform
+        # Each post's fields are read once and fill every column in the same pass
+        n = len(posts)
         if platform == 'twitter':
-            likes = [post.get('likes', 0) for post in posts]
-            retweets = [post.get('retweets', 0) for post in posts]
-            replies = [post.get('replies', 0) for post in posts]
-
-            engagement_scores = [
-                post.get('likes', 0) + (post.get('retweets', 0) * 2) + post.get('replies', 0)
-                for post in posts
-            ]
+            likes = [0] * n
+            retweets = [0] * n
+            replies = [0] * n
+            engagement_scores = [0] * n
+            for i, post in enumerate(posts):
+                like = post.get('likes', 0)
+                retweet = post.get('retweets', 0)
+                reply = post.get('replies', 0)
+                likes[i] = like
+                retweets[i] = retweet
+                replies[i] = reply
+                engagement_scores[i] = like + (retweet * 2) + reply
 
         elif platform == 'youtube':
-            views = [post.get('views', 0) for post in posts]
-            likes = [post.get('likes', 0) for post in posts]
-            comments = [post.get('comments', 0) for post in posts]
-
-            engagement_scores = [
-                (post.get('views', 0) * 0.01) + post.get('likes', 0) + (post.get('comments', 0) * 1.5)
-                for post in posts
-            ]
+            views = [0] * n
+            likes = [0] * n
+            comments = [0] * n
+            engagement_scores = [0.0] * n
+            for i, post in enumerate(posts):
+                view = post.get('views', 0)
+                like = post.get('likes', 0)
+                comment = post.get('comments', 0)
+                views[i] = view
+                likes[i] = like
+                comments[i] = comment
+                engagement_scores[i] = (view * 0.01) + like + (comment * 1.5)
 
 
         # Calculate additional sophisticated metrics
@@ -132,7 +143,6 @@ class SocialMediaAnalyzer:
             try:
                 timestamp = view.get('timestamp', '')
                 if timestamp:
-                    from datetime import datetime
                     dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
                     hour = dt.hour
                     time_of_day_counts[hour] = time_of_day_counts.get(hour, 0) + 1
@@ -145,7 +155,6 @@ class SocialMediaAnalyzer:
             tags_str = view.get('tags', '')
             if tags_str:
                 try:
-                    import json
                     tags = json.loads(tags_str) if isinstance(tags_str, str) else tags_str
                     for tag in tags:
                         tag_clean = tag.lstrip('#').lower()
@@ -204,7 +213,7 @@ class SocialMediaAnalyzer:
             'peak_activity_hours': dict(hour_counts.most_common(5)),
             'top_hashtags': dict(hashtag_counts.most_common(10)),
             'total_unique_locations': len(location_counts),
-            'most_active_hour': hour_counts.most_common(1)[0][0] if hour_counts else None
+            'most_active_hour': max(hour_counts, key=hour_counts.get) if hour_counts else None
         }
 
         return demographics
@@ -412,8 +421,8 @@ class SocialMediaAnalyzer:
         return {
             'peak_hours': dict(hour_counts.most_common(5)),
             'peak_days': day_name_counts,
-            'best_hour_for_posting': hour_counts.most_common(1)[0][0] if hour_counts else None,
-            'best_day_for_posting': day_names[day_counts.most_common(1)[0][0]] if day_counts else None
+            'best_hour_for_posting': max(hour_counts, key=hour_counts.get) if hour_counts else None,
+            'best_day_for_posting': day_names[max(day_counts, key=day_counts.get)] if day_counts else None
         }
 
     def _analyze_sentiment(self, text: str) -> float:
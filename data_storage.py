@@ -159,11 +159,24 @@ class DataStorage:
         rows = cursor.fetchall()
 
         columns = [description[0] for description in cursor.description]
-        viewing_history = [dict(zip(columns, row)) for row in rows]
+        viewing_history = self._hydrate_tags([dict(zip(columns, row)) for row in rows])
 
         conn.close()
         return viewing_history
 
+    @staticmethod
+    def _hydrate_tags(rows: List[Dict]) -> List[Dict]:
+        """Decode each row's JSON tags column into a list in place, using [] for missing or malformed values"""
+        for row in rows:
+            tags = row.get('tags')
+            if isinstance(tags, str):
+                try:
+                    tags = json.loads(tags)
+                except json.JSONDecodeError:
+                    tags = []
+            row['tags'] = tags if isinstance(tags, list) else []
+        return rows
+
     def get_viewing_stats_24h(self, user_id: str = 'default_user') -> Dict:
         """Get viewing statistics for the last 24 hours"""
         conn = sqlite3.connect(self.db_path)
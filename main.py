@@ -14,6 +14,8 @@ import time
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
 from flask_socketio import SocketIO, emit
 from config import AppConfig
+from operator import itemgetter
+import hashlib
 import json
 import os
 
@@ -30,10 +32,14 @@ recommendation_engine = RecommendationEngine(storage, analyzer)
 personal_analytics = PersonalAnalytics(storage)
 real_time_collector = None  # Will be initialized in the main function
 
+# Column getters for engagement chart series
+_get_created_at = itemgetter('created_at')
+_get_engagement_score = itemgetter('engagement_score')
+
 # Store dashboard state
 dashboard_data = {
-    'twitter_engagement': [],
-    'youtube_engagement': [],
+    'twitter_engagement': {'times': [], 'engagements': []},
+    'youtube_engagement': {'times': [], 'engagements': []},
     'trending_hashtags': [],
     'high_engagement_posts': [],
     'personal_recommendations': recommendation_engine._generate_mock_recommendations(5),
@@ -41,6 +47,15 @@ dashboard_data = {
 }
 
 
+def cached_json_response(payload, max_age=30):
+    """Return a JSON response tagged with a weak ETag, answering 304 when the client's copy is current"""
+    response = jsonify(payload)
+    etag = hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = f'private, max-age={max_age}'
+    return response.make_conditional(request)
+
+
 @app.route('/')
 def index():
     """Serve the main dashboard page"""
@@ -210,7 +225,7 @@ def get_personal_insights():
     try:
         user_id = request.args.get('user_id', 'default_user')
         insights = personal_analytics.get_personal_insights(user_id)
-        return jsonify({
+        return cached_json_response({
             'status': 'success',
             'insights': insights
         })
@@ -266,7 +281,7 @@ def get_personal_history():
         limit = int(request.args.get('limit', 50))
 
         history = storage.get_personal_viewing_history(user_id, limit)
-        return jsonify({
+        return cached_json_response({
             'status': 'success',
             'history': history
         })
@@ -385,7 +400,7 @@ def export_user_data():
         user_id = request.args.get('user_id', 'default_user')
         # In a real implementation, this would return user's data
         history = storage.get_personal_viewing_history(user_id, limit=100)
-        return jsonify({
+        return cached_json_response({
             'user_id': user_id,
             'viewing_history': history,
             'preferences': storage.get_user_preferences(user_id)
@@ -417,6 +432,14 @@ def delete_user_data():
         })
 
 
+def build_engagement_series(posts):
+    """Split posts into parallel 'times' and 'engagements' columns for charting"""
+    return {
+        'times': list(map(_get_created_at, posts)),
+        'engagements': list(map(_get_engagement_score, posts))
+    }
+
+
 def update_dashboard_data():
     """Background function to periodically update dashboard data"""
     global dashboard_data
@@ -430,16 +453,9 @@ def update_dashboard_data():
             twitter_posts = [p for p in recent_posts if p['platform'] == 'twitter']
             youtube_posts = [p for p in recent_posts if p['platform'] == 'youtube']
 
-            # Prepare engagement data (timestamp, engagement score)
-            twitter_engagement = [
-                {'time': p['created_at'], 'engagement': p['engagement_score']}
-                for p in twitter_posts
-            ]
-
-            youtube_engagement = [
-                {'time': p['created_at'], 'engagement': p['engagement_score']}
-                for p in youtube_posts
-            ]
+            # Prepare engagement data as parallel time/engagement columns
+            twitter_engagement = build_engagement_series(twitter_posts)
+            youtube_engagement = build_engagement_series(youtube_posts)
 
             # Update trending hashtags
             trending_hashtags = storage.get_trending_hashtags(hours=1, limit=10)
@@ -3,11 +3,66 @@ Recommendation Engine for Personalized Content Suggestions
 Based on viewing history and user preferences
 """
 
+import heapq
 import random
+import string
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from itertools import islice
 from typing import Dict, List
+import numpy as np
 from data_storage import DataStorage
 from analyzer import SocialMediaAnalyzer
 
+_TWITTER = sys.intern('Twitter')
+_YOUTUBE = sys.intern('YouTube')
+_DEFAULT_PLATFORMS = (_TWITTER, _YOUTUBE)
+
+# ASCII-only lowercase table for hashtag normalization
+_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+@dataclass
+class ViewingHistoryColumns:
+    """
+    Column-oriented view of viewing history rows
+    """
+    platforms: List[str]
+    durations: np.ndarray
+    tags: List[List[str]]
+
+    def __len__(self) -> int:
+        return len(self.platforms)
+
+
+def _normalize_tag(tag: str) -> str:
+    """
+    Drop a leading '#' and lowercase the tag, using one translate pass for ASCII tags
+    """
+    if tag.startswith('#'):
+        tag = tag[1:]
+    # isascii() is a constant-time flag check; non-ASCII tags still need full Unicode lowercasing
+    return tag.translate(_LOWER_TABLE) if tag.isascii() else tag.lower()
+
+
+def prepare_viewing_columns(viewing_history: List[Dict]) -> ViewingHistoryColumns:
+    """
+    Split viewing history rows into platform, duration and tag columns in a single pass
+    Tags arrive already decoded into lists by DataStorage
+    """
+    platforms = []
+    tags = []
+    for view in viewing_history:
+        platforms.append(view.get('platform', 'unknown'))
+        tags.append(view.get('tags') or [])
+
+    # Any row may hold a NULL duration (the tracking endpoint stores whatever the client sent), so cast each one
+    duration_values = (int(v.get('watch_duration') or 0) for v in viewing_history)
+    durations = np.fromiter(duration_values, dtype=np.int64, count=len(viewing_history))
+
+    return ViewingHistoryColumns(platforms=platforms, durations=durations, tags=tags)
+
 
 class RecommendationEngine:
     """
@@ -18,6 +73,7 @@ class RecommendationEngine:
         self.storage = storage or DataStorage()
         self.analyzer = analyzer or SocialMediaAnalyzer()
         self.user_id = 'default_user'
+        self._rng = np.random.default_rng()
         
     def get_user_recommendations(self, user_id: str = 'default_user', count: int = 10) -> List[Dict]:
         """
@@ -35,7 +91,7 @@ class RecommendationEngine:
             return self._generate_mock_recommendations(count)
 
         # Extract preferred topics and hashtags from user data
-        preferred_topics = self._extract_preferred_topics(preferences, viewing_history)
+        preferred_topics = self._extract_preferred_topics(preferences, prepare_viewing_columns(viewing_history))
 
         # Generate recommendations based on user preferences
         recommendations = self._generate_recommendations(preferred_topics, count)
@@ -50,62 +106,53 @@ class RecommendationEngine:
         """
         Generate mock recommendations when no user data is available
         """
-        import random
-        platforms = ['Twitter', 'YouTube']
+        platforms = _DEFAULT_PLATFORMS
         hashtags = ['technology', 'python', 'socialmedia', 'analytics', 'data', 'programming', 'coding', 'webdev']
 
-        recommendations = []
-        for i in range(count):
-            hashtag = random.choice(hashtags)
-            platform = random.choice(platforms)
+        # Draw every random field for all recommendations in bulk
+        chosen_hashtags = self._rng.choice(hashtags, size=count).tolist()
+        related_hashtags = self._rng.choice(hashtags, size=count).tolist()
+        chosen_platforms = self._rng.choice(platforms, size=count).tolist()
+        id_suffixes = self._rng.integers(1000, 10000, size=count).tolist()
+        confidence_scores = self._rng.uniform(0.5, 0.8, size=count).round(2).tolist()
+        watch_times = self._rng.integers(60, 601, size=count).tolist()  # in seconds
 
-            recommendation = {
-                'id': f'mock_rec_{i}_{random.randint(1000, 9999)}',
+        recommendations = []
+        for i, (hashtag, related, platform, suffix, confidence, watch_time) in enumerate(
+                zip(chosen_hashtags, related_hashtags, chosen_platforms, id_suffixes, confidence_scores, watch_times)):
+            recommendations.append({
+                'id': f'mock_rec_{i}_{suffix}',
                 'platform': platform,
                 'title': f'Mock recommended content about #{hashtag} on {platform}',
                 'description': f'Based on trending topics in #{hashtag} and similar content',
                 'url': f'https://{platform.lower()}.com/mock/{i}',
-                'recommended_for': [hashtag, random.choice(hashtags)],
-                'confidence_score': round(random.uniform(0.5, 0.8), 2),
-                'estimated_watch_time': random.randint(60, 600)  # in seconds
-            }
-
-            recommendations.append(recommendation)
+                'recommended_for': [hashtag, related],
+                'confidence_score': confidence,
+                'estimated_watch_time': watch_time
+            })
 
         return recommendations
     
-    def _extract_preferred_topics(self, preferences: List[Dict], viewing_history: List[Dict]) -> Dict:
+    def _extract_preferred_topics(self, preferences: List[Dict], viewing_columns: ViewingHistoryColumns) -> Dict:
         """
         Extract preferred topics and hashtags from user data
         """
-        topics = {'hashtags': {}, 'categories': {}, 'platforms': {}}
+        hashtag_counter = Counter()
+        category_counter = Counter()
+        platform_counter = Counter(viewing_columns.platforms)
         
-        # Process user preferences
-        for pref in preferences:
-            if pref['preference_type'] == 'hashtag':
-                topics['hashtags'][pref['preference_value']] = pref['frequency']
-            elif pref['preference_type'] == 'category':
-                topics['categories'][pref['preference_value']] = pref['frequency']
+        # Seed counters from stored user preferences
+        hashtag_counter.update({p['preference_value']: p['frequency']
+                                for p in preferences if p['preference_type'] == 'hashtag'})
+        category_counter.update({p['preference_value']: p['frequency']
+                                 for p in preferences if p['preference_type'] == 'category'})
         
-        # Process viewing history to extract additional preferences
-        for view in viewing_history:
-            # Extract hashtags from tags if available
-            if view.get('tags'):
-                try:
-                    import json
-                    tags = json.loads(view['tags']) if isinstance(view['tags'], str) else view['tags']
-                    for tag in tags:
-                        tag_clean = tag.lstrip('#').lower()
-                        topics['hashtags'][tag_clean] = topics['hashtags'].get(tag_clean, 0) + 1
-                except:
-                    pass  # If JSON parsing fails, skip this entry
+        # Add hashtags from the already-parsed viewing history tags
+        for tags in viewing_columns.tags:
+            if tags:
+                hashtag_counter.update(map(_normalize_tag, tags))
         
-        # Count platform preferences
-        for view in viewing_history:
-            platform = view.get('platform', 'unknown')
-            topics['platforms'][platform] = topics['platforms'].get(platform, 0) + 1
-        
-        return topics
+        return {'hashtags': hashtag_counter, 'categories': category_counter, 'platforms': platform_counter}
     
     def _generate_recommendations(self, preferred_topics: Dict, count: int) -> List[Dict]:
         """
@@ -113,14 +160,24 @@ class RecommendationEngine:
         """
         recommendations = []
         
-        # Generate recommendations based on hashtags
-        top_hashtags = sorted(preferred_topics['hashtags'].items(), 
-                             key=lambda x: x[1], reverse=True)[:5]
+        # Draw all platforms (weighted by viewing frequency) and hashtags up front
+        platform_preferences = preferred_topics['platforms']
+        if platform_preferences:
+            chosen_platforms = random.choices([p.title() for p in platform_preferences],
+                                              weights=list(platform_preferences.values()), k=count)
+        else:
+            chosen_platforms = random.choices(_DEFAULT_PLATFORMS, k=count)
+        
+        hashtag_keys = list(preferred_topics['hashtags']) or ['technology']
+        chosen_hashtags = random.choices(hashtag_keys, k=count)
+        
+        # Same for every recommendation; serialized only, so one list can be shared
+        recommended_for = list(islice(preferred_topics['hashtags'], 3))
         
         # Generate mock recommendations based on user preferences
         for i in range(count):
-            platform = self._select_platform(preferred_topics['platforms'])
-            hashtag = random.choice(list(preferred_topics['hashtags'].keys())) if preferred_topics['hashtags'] else 'technology'
+            platform = chosen_platforms[i]
+            hashtag = chosen_hashtags[i]
             
             recommendation = {
                 'id': f'rec_{i}_{random.randint(1000, 9999)}',
@@ -128,7 +185,7 @@ class RecommendationEngine:
                 'title': f'Recommended content about #{hashtag} on {platform}',
                 'description': f'Based on your interest in #{hashtag} and similar content',
                 'url': f'https://{platform.lower()}.com/recommended/{i}',
-                'recommended_for': list(preferred_topics['hashtags'].keys())[:3],
+                'recommended_for': recommended_for,
                 'confidence_score': round(random.uniform(0.7, 0.95), 2),
                 'estimated_watch_time': random.randint(60, 600)  # in seconds
             }
@@ -143,12 +200,12 @@ class RecommendationEngine:
         """
         if not platform_preferences:
             # Default to Twitter or YouTube if no preferences
-            return random.choice(['Twitter', 'YouTube'])
+            return random.choice(_DEFAULT_PLATFORMS)
         
         # Weighted random selection based on preference frequency
         total_weight = sum(platform_preferences.values())
         if total_weight == 0:
-            return random.choice(['Twitter', 'YouTube'])
+            return random.choice(_DEFAULT_PLATFORMS)
         
         rand_val = random.uniform(0, total_weight)
         current_weight = 0
@@ -158,7 +215,7 @@ class RecommendationEngine:
             if rand_val <= current_weight:
                 return platform.title()  # Capitalize properly
         
-        return random.choice(['Twitter', 'YouTube'])
+        return random.choice(_DEFAULT_PLATFORMS)
     
     def update_user_profile(self, user_id: str, content_id: str, engagement_type: str = 'view'):
         """
@@ -171,15 +228,8 @@ class RecommendationEngine:
             content = viewing_history[0]
             
             # Extract hashtags and update preferences
-            if content.get('tags'):
-                try:
-                    import json
-                    tags = json.loads(content['tags']) if isinstance(content['tags'], str) else content['tags']
-                    for tag in tags:
-                        tag_clean = tag.lstrip('#').lower()
-                        self.storage.update_user_preference(user_id, 'hashtag', tag_clean)
-                except:
-                    pass  # If JSON parsing fails, skip this entry
+            for tag in content.get('tags') or ():
+                self.storage.update_user_preference(user_id, 'hashtag', _normalize_tag(tag))
             
             # Update category preferences based on platform
             platform = content.get('platform', 'unknown')
@@ -194,6 +244,7 @@ class PersonalAnalytics:
     def __init__(self, storage: DataStorage = None):
         self.storage = storage or DataStorage()
         self.user_id = 'default_user'
+        self._rng = np.random.default_rng()
     
     def get_personal_insights(self, user_id: str = 'default_user') -> Dict:
         """
@@ -217,7 +268,7 @@ class PersonalAnalytics:
 
         # Calculate insights
         insights = {
-            'viewing_summary': self._calculate_viewing_summary(stats_24h, viewing_history),
+            'viewing_summary': self._calculate_viewing_summary(stats_24h, prepare_viewing_columns(viewing_history)),
             'preferred_topics': self._get_preferred_topics(preferences),
             'platform_preferences': self._get_platform_preferences(stats_24h),
             'trending_interests': self._get_trending_interests(preferences),
@@ -234,15 +285,22 @@ class PersonalAnalytics:
         """
         Generate mock insights when no user data is available
         """
-        import random
+        # Draw all random counts and durations in one call (bounds are inclusive)
+        low = [5, 300, 60, 2, 100, 3, 200, 2, 100, 3, 200]
+        high = [20, 1800, 300, 10, 500, 12, 800, 10, 500, 12, 800]
+        (total_viewed, total_watch, average_watch,
+         tw_count, tw_duration, yt_count, yt_duration,
+         tw_pref_count, tw_pref_duration, yt_pref_count, yt_pref_duration) = \
+            self._rng.integers(low, np.add(high, 1)).tolist()
+
         return {
             'viewing_summary': {
-                'total_content_viewed': random.randint(5, 20),
-                'total_watch_time': random.randint(300, 1800),  # seconds
-                'average_watch_time': random.randint(60, 300),  # seconds
+                'total_content_viewed': total_viewed,
+                'total_watch_time': total_watch,  # seconds
+                'average_watch_time': average_watch,  # seconds
                 'content_by_platform': {
-                    'twitter': {'content_count': random.randint(2, 10), 'total_duration': random.randint(100, 500)},
-                    'youtube': {'content_count': random.randint(3, 12), 'total_duration': random.randint(200, 800)}
+                    'twitter': {'content_count': tw_count, 'total_duration': tw_duration},
+                    'youtube': {'content_count': yt_count, 'total_duration': yt_duration}
                 }
             },
             'preferred_topics': [
@@ -251,22 +309,22 @@ class PersonalAnalytics:
                 {'preference_value': 'analytics', 'frequency': 5}
             ],
             'platform_preferences': {
-                'twitter': {'content_count': random.randint(2, 10), 'total_duration': random.randint(100, 500)},
-                'youtube': {'content_count': random.randint(3, 12), 'total_duration': random.randint(200, 800)}
+                'twitter': {'content_count': tw_pref_count, 'total_duration': tw_pref_duration},
+                'youtube': {'content_count': yt_pref_count, 'total_duration': yt_pref_duration}
             },
             'trending_interests': [
                 {'preference_value': 'machine learning', 'frequency': 5, 'last_used': '2023-01-04T10:00:00'},
                 {'preference_value': 'data science', 'frequency': 4, 'last_used': '2023-01-04T09:30:00'}
             ],
-            'recommendation_accuracy': round(random.uniform(0.6, 0.85), 2)
+            'recommendation_accuracy': round(float(self._rng.uniform(0.6, 0.85)), 2)
         }
     
-    def _calculate_viewing_summary(self, stats_24h: Dict, viewing_history: List[Dict]) -> Dict:
+    def _calculate_viewing_summary(self, stats_24h: Dict, viewing_columns: ViewingHistoryColumns) -> Dict:
         """
         Calculate viewing summary for the user
         """
-        total_content = len(viewing_history)
-        total_duration = sum(int(v.get('watch_duration', 0)) for v in viewing_history)
+        total_content = len(viewing_columns)
+        total_duration = int(viewing_columns.durations.sum())
         
         summary = {
             'total_content_viewed': total_content,
@@ -281,10 +339,9 @@ class PersonalAnalytics:
         """
         Get user's preferred topics based on frequency
         """
-        hashtags = [p for p in preferences if p['preference_type'] == 'hashtag']
-        hashtags.sort(key=lambda x: x['frequency'], reverse=True)
-        
-        return hashtags[:10]  # Top 10 preferred topics
+        # Top 10 preferred topics
+        return heapq.nlargest(10, (p for p in preferences if p['preference_type'] == 'hashtag'),
+                              key=lambda x: x['frequency'])
     
     def _get_platform_preferences(self, stats_24h: Dict) -> Dict:
         """
@@ -296,9 +353,8 @@ class PersonalAnalytics:
         """
         Get trending interests based on recent activity
         """
-        # Sort by last used timestamp (most recent first)
-        preferences.sort(key=lambda x: x.get('last_used', ''), reverse=True)
-        return preferences[:5]  # Top 5 recent interests
+        # Top 5 recent interests by last used timestamp, without reordering the caller's list
+        return heapq.nlargest(5, preferences, key=lambda x: x.get('last_used', ''))
     
     def _calculate_recommendation_accuracy(self, viewing_history: List[Dict]) -> float:
         """
@@ -3,13 +3,38 @@ Report generation module for social media analytics
 Creates detailed reports based on collected data
 """
 
+import io
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List
 import json
 from data_storage import DataStorage
 from analyzer import SocialMediaAnalyzer
 
+_TWITTER = sys.intern('Twitter')
+_YOUTUBE = sys.intern('YouTube')
+_DEFAULT_PLATFORMS = (_TWITTER, _YOUTUBE)
+
+# Text report rules
+_RULE = "=" * 60
+_SEP = _RULE + "\n"
+_SUBSEP = "-" * 40 + "\n"
+
+# Line formatters bound once and reused by the per-item report loops
+_fmt_pair = "    - {}: {}\n".format
+_fmt_hour = "    - {}:00: {}\n".format
+_fmt_numbered = "  {}. {}\n".format
+_fmt_trending = "  {}. {} ({} mentions)\n".format
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 class ReportGenerator:
     """
@@ -20,14 +45,18 @@ class ReportGenerator:
         self.storage = storage or DataStorage()
         self.analyzer = analyzer or SocialMediaAnalyzer()
         self.report_directory = "reports"
+        self._platform_report_cache = {}  # platform -> report, reused for the lifetime of this generator
         
         # Create reports directory if it doesn't exist
         os.makedirs(self.report_directory, exist_ok=True)
 
-    def generate_platform_report(self, platform: str) -> Dict:
+    def generate_platform_report(self, platform: str, generated_at: str = None) -> Dict:
         """
         Generate a detailed report for a specific platform
         """
+        if platform in self._platform_report_cache:
+            return self._platform_report_cache[platform]
+        
         # Get posts and metrics for the platform
         posts = self.storage.get_posts_by_platform(platform)
         metrics = self.storage.get_metrics_by_platform(platform)
@@ -48,7 +77,7 @@ class ReportGenerator:
         
         report = {
             'platform': platform,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at or datetime.now().isoformat(),
             'engagement_analysis': engagement_analysis,
             'audience_demographics': audience_demographics,
             'peak_times': peak_times,
@@ -57,22 +86,26 @@ class ReportGenerator:
             'total_metrics': len(metrics)
         }
         
+        self._platform_report_cache[platform] = report
         return report
 
-    def generate_comparison_report(self, platforms: List[str] = ['Twitter', 'YouTube']) -> Dict:
+    def generate_comparison_report(self, platforms: tuple = _DEFAULT_PLATFORMS, prebuilt: Dict = None,
+                                   generated_at: str = None) -> Dict:
         """
         Generate a comparison report between multiple platforms
+        Platform reports found in prebuilt are reused instead of regenerated
         """
-        platform_reports = {}
+        prebuilt = prebuilt or {}
+        missing = [p for p in platforms if not prebuilt.get(p)]
+        built = self.generate_platform_reports(missing, generated_at) if missing else {}
         
-        for platform in platforms:
-            platform_reports[platform] = self.generate_platform_report(platform)
+        platform_reports = {p: prebuilt.get(p) or built[p] for p in platforms}
         
         # Get cross-platform insights
         insights = self._generate_cross_platform_insights(platform_reports)
         
         report = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at or datetime.now().isoformat(),
             'platforms': platform_reports,
             'cross_platform_insights': insights,
             'comparison_summary': self._create_comparison_summary(platform_reports)
@@ -80,14 +113,23 @@ class ReportGenerator:
         
         return report
 
-    def generate_trending_report(self) -> Dict:
+    def generate_platform_reports(self, platforms: List[str], generated_at: str = None) -> Dict:
+        """
+        Generate reports for several platforms concurrently, keyed by platform
+        Relies on DataStorage opening a fresh SQLite connection per call, which keeps it safe across threads
+        """
+        with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+            reports = executor.map(lambda p: self.generate_platform_report(p, generated_at), platforms)
+            return dict(zip(platforms, reports))
+
+    def generate_trending_report(self, generated_at: str = None) -> Dict:
         """
         Generate a report on trending hashtags and topics
         """
         trending_hashtags = self.storage.get_trending_hashtags(hours=24, limit=20)
         
         report = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at or datetime.now().isoformat(),
             'trending_hashtags': trending_hashtags,
             'trending_summary': self._create_trending_summary(trending_hashtags)
         }
@@ -104,8 +146,13 @@ class ReportGenerator:
         
         filepath = os.path.join(self.report_directory, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        if _HAS_ORJSON:
+            # orjson serializes in C and emits UTF-8 bytes directly
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
         return filepath
 
@@ -113,89 +160,111 @@ class ReportGenerator:
         """
         Generate a human-readable text report
         """
-        report_lines = []
-        report_lines.append("="*60)
-        report_lines.append("SOCIAL MEDIA ANALYTICS REPORT")
-        report_lines.append("="*60)
-        report_lines.append(f"Generated at: {report_data.get('generated_at', 'N/A')}")
-        report_lines.append("")
+        buf = io.StringIO()
+        w = buf.write
         
-        if 'platform' in report_data:  # Single platform report
-            platform = report_data['platform']
-            report_lines.append(f"PLATFORM: {platform.upper()}")
-            report_lines.append("-" * 40)
-            
-            # Engagement analysis
-            engagement = report_data.get('engagement_analysis', {})
-            report_lines.append("ENGAGEMENT ANALYSIS:")
-            report_lines.append(f"  Total Posts: {report_data.get('total_posts', 0)}")
-            report_lines.append(f"  Average Engagement: {engagement.get('avg_engagement', 0)}")
-            report_lines.append(f"  Median Engagement: {engagement.get('median_engagement', 0)}")
-            report_lines.append(f"  Max Engagement: {engagement.get('max_engagement', 0)}")
-            report_lines.append("")
-            
-            # Audience demographics
-            demographics = report_data.get('audience_demographics', {})
-            report_lines.append("AUDIENCE DEMOGRAPHICS:")
-            top_locations = demographics.get('top_locations', {})
-            if top_locations:
-                report_lines.append("  Top Locations:")
-                for location, count in list(top_locations.items())[:5]:
-                    report_lines.append(f"    - {location}: {count}")
-            
-            peak_hours = demographics.get('peak_activity_hours', {})
-            if peak_hours:
-                report_lines.append("  Peak Activity Hours:")
-                for hour, count in list(peak_hours.items())[:5]:
-                    report_lines.append(f"    - {hour}:00: {count}")
-            
-            top_hashtags = demographics.get('top_hashtags', {})
-            if top_hashtags:
-                report_lines.append("  Top Hashtags:")
-                for hashtag, count in list(top_hashtags.items())[:10]:
-                    report_lines.append(f"    - {hashtag}: {count}")
-            report_lines.append("")
-            
-            # Insights
-            insights = report_data.get('insights', [])
-            if insights:
-                report_lines.append("ACTIONABLE INSIGHTS:")
-                for i, insight in enumerate(insights, 1):
-                    report_lines.append(f"  {i}. {insight}")
-            report_lines.append("")
+        self._write_text_report_header(w, report_data)
         
+        if 'platform' in report_data:  # Single platform report
+            self._write_platform_text_section(w, report_data)
         elif 'platforms' in report_data:  # Comparison report
-            report_lines.append("CROSS-PLATFORM COMPARISON REPORT")
-            report_lines.append("-" * 40)
-            
-            for platform, data in report_data['platforms'].items():
-                report_lines.append(f"{platform.upper()}:")
-                engagement = data.get('engagement_analysis', {})
-                report_lines.append(f"  Average Engagement: {engagement.get('avg_engagement', 0)}")
-                report_lines.append(f"  Total Posts: {data.get('total_posts', 0)}")
-                report_lines.append("")
-            
-            # Cross-platform insights
-            cross_insights = report_data.get('cross_platform_insights', [])
-            if cross_insights:
-                report_lines.append("CROSS-PLATFORM INSIGHTS:")
-                for i, insight in enumerate(cross_insights, 1):
-                    report_lines.append(f"  {i}. {insight}")
-            report_lines.append("")
-        
+            self._write_comparison_text_section(w, report_data)
         elif 'trending_hashtags' in report_data:  # Trending report
-            report_lines.append("TRENDING HASHTAGS REPORT")
-            report_lines.append("-" * 40)
-            
-            hashtags = report_data['trending_hashtags']
-            report_lines.append("TOP TRENDING HASHTAGS:")
-            for i, hashtag_data in enumerate(hashtags[:10], 1):
-                report_lines.append(f"  {i}. {hashtag_data['hashtag']} ({hashtag_data['count']} mentions)")
-            report_lines.append("")
+            self._write_trending_text_section(w, report_data)
+        
+        w(_RULE)
         
-        report_lines.append("="*60)
+        return buf.getvalue()
+
+    def _write_text_report_header(self, w, report_data: Dict):
+        """
+        Write the banner lines shared by every text report
+        """
+        w(_SEP)
+        w("SOCIAL MEDIA ANALYTICS REPORT\n")
+        w(_SEP)
+        w(f"Generated at: {report_data.get('generated_at', 'N/A')}\n")
+        w("\n")
+
+    def _write_platform_text_section(self, w, report_data: Dict):
+        """
+        Write the text lines for a single platform report
+        """
+        platform = report_data['platform']
+        engagement = report_data.get('engagement_analysis', {})
+        w(f"PLATFORM: {platform.upper()}\n")
+        w(_SUBSEP)
+        
+        # Engagement analysis
+        w("ENGAGEMENT ANALYSIS:\n")
+        w(f"  Total Posts: {report_data.get('total_posts', 0)}\n")
+        w(f"  Average Engagement: {engagement.get('avg_engagement', 0)}\n")
+        w(f"  Median Engagement: {engagement.get('median_engagement', 0)}\n")
+        w(f"  Max Engagement: {engagement.get('max_engagement', 0)}\n")
+        w("\n")
+        
+        # Audience demographics
+        w("AUDIENCE DEMOGRAPHICS:\n")
+        demographics = report_data.get('audience_demographics', {})
+        top_locations = demographics.get('top_locations', {})
+        if top_locations:
+            w("  Top Locations:\n")
+            for location, count in islice(top_locations.items(), 5):
+                w(_fmt_pair(location, count))
+        
+        peak_hours = demographics.get('peak_activity_hours', {})
+        if peak_hours:
+            w("  Peak Activity Hours:\n")
+            for hour, count in islice(peak_hours.items(), 5):
+                w(_fmt_hour(hour, count))
         
-        return "\n".join(report_lines)
+        top_hashtags = demographics.get('top_hashtags', {})
+        if top_hashtags:
+            w("  Top Hashtags:\n")
+            for hashtag, count in islice(top_hashtags.items(), 10):
+                w(_fmt_pair(hashtag, count))
+        w("\n")
+        
+        # Insights
+        insights = report_data.get('insights', [])
+        if insights:
+            w("ACTIONABLE INSIGHTS:\n")
+            for i, insight in enumerate(insights, 1):
+                w(_fmt_numbered(i, insight))
+        w("\n")
+
+    def _write_comparison_text_section(self, w, report_data: Dict):
+        """
+        Write the text lines for a cross-platform comparison report
+        """
+        w("CROSS-PLATFORM COMPARISON REPORT\n")
+        w(_SUBSEP)
+        
+        for platform, data in report_data['platforms'].items():
+            engagement = data.get('engagement_analysis', {})
+            w(f"{platform.upper()}:\n")
+            w(f"  Average Engagement: {engagement.get('avg_engagement', 0)}\n")
+            w(f"  Total Posts: {data.get('total_posts', 0)}\n")
+            w("\n")
+        
+        # Cross-platform insights
+        cross_insights = report_data.get('cross_platform_insights', [])
+        if cross_insights:
+            w("CROSS-PLATFORM INSIGHTS:\n")
+            for i, insight in enumerate(cross_insights, 1):
+                w(_fmt_numbered(i, insight))
+        w("\n")
+
+    def _write_trending_text_section(self, w, report_data: Dict):
+        """
+        Write the text lines for a trending hashtags report
+        """
+        w("TRENDING HASHTAGS REPORT\n")
+        w(_SUBSEP)
+        w("TOP TRENDING HASHTAGS:\n")
+        for i, hashtag_data in enumerate(islice(report_data['trending_hashtags'], 10), 1):
+            w(_fmt_trending(i, hashtag_data['hashtag'], hashtag_data['count']))
+        w("\n")
 
     def save_text_report(self, report_data: Dict, report_type: str, filename: str = None) -> str:
         """
@@ -231,7 +300,7 @@ class ReportGenerator:
         # Demographic insights
         top_locations = demographics.get('top_locations', {})
         if top_locations:
-            top_location = next(iter(top_locations))
+            top_location = self._first_key(top_locations)
             insights.append(f"Most of your {platform} audience is from {top_location}. Target content to this region.")
         
         peak_hour = demographics.get('most_active_hour')
@@ -241,28 +310,37 @@ class ReportGenerator:
         # Hashtag insights
         top_hashtags = demographics.get('top_hashtags', {})
         if top_hashtags:
-            top_hashtag = next(iter(top_hashtags))
+            top_hashtag = self._first_key(top_hashtags)
             insights.append(f"Your most popular hashtag is {top_hashtag}. Use this and similar hashtags more often.")
         
         return insights
 
+    @staticmethod
+    def _first_key(ranked):
+        """
+        Return the top entry's key from a ranked dict or a most_common()-style list of pairs
+        """
+        if isinstance(ranked, dict):
+            return next(iter(ranked))
+        return ranked[0][0]
+
     def _generate_cross_platform_insights(self, platform_reports: Dict) -> List[str]:
         """
         Generate insights comparing multiple platforms
         """
         insights = []
         
-        if 'Twitter' in platform_reports and 'YouTube' in platform_reports:
-            tw_avg_engagement = platform_reports['Twitter']['engagement_analysis'].get('avg_engagement', 0)
-            yt_avg_engagement = platform_reports['YouTube']['engagement_analysis'].get('avg_engagement', 0)
+        if _TWITTER in platform_reports and _YOUTUBE in platform_reports:
+            tw_avg_engagement = platform_reports[_TWITTER]['engagement_analysis'].get('avg_engagement', 0)
+            yt_avg_engagement = platform_reports[_YOUTUBE]['engagement_analysis'].get('avg_engagement', 0)
             
             if tw_avg_engagement > yt_avg_engagement * 2:
                 insights.append("Twitter performs significantly better than YouTube. Consider focusing more resources on Twitter.")
             elif yt_avg_engagement > tw_avg_engagement * 2:
                 insights.append("YouTube performs significantly better than Twitter. Consider focusing more resources on YouTube.")
             
-            tw_posts = platform_reports['Twitter']['total_posts']
-            yt_posts = platform_reports['YouTube']['total_posts']
+            tw_posts = platform_reports[_TWITTER]['total_posts']
+            yt_posts = platform_reports[_YOUTUBE]['total_posts']
             
             if tw_posts > yt_posts * 2:
                 insights.append("You're posting much more frequently on Twitter than YouTube. Consider balancing your content distribution.")
@@ -310,24 +388,34 @@ def generate_full_report():
     analyzer = SocialMediaAnalyzer()
     generator = ReportGenerator(storage, analyzer)
     
+    # Take one wall-clock reading so every sub-report and both file names share it
+    now = datetime.now()
+    generated_at = now.isoformat(timespec='seconds')
+    file_timestamp = now.strftime("%Y%m%d_%H%M%S")
+    
     # Generate individual reports
-    twitter_report = generator.generate_platform_report('Twitter')
-    youtube_report = generator.generate_platform_report('YouTube')
-    comparison_report = generator.generate_comparison_report()
-    trending_report = generator.generate_trending_report()
+    platform_reports = generator.generate_platform_reports(_DEFAULT_PLATFORMS, generated_at)
+    twitter_report = platform_reports[_TWITTER]
+    youtube_report = platform_reports[_YOUTUBE]
+    comparison_report = generator.generate_comparison_report(prebuilt=platform_reports, generated_at=generated_at)
+    trending_report = generator.generate_trending_report(generated_at)
     
     # Combine into a full report
     full_report = {
-        'generated_at': datetime.now().isoformat(),
+        'generated_at': generated_at,
         'twitter_report': twitter_report,
         'youtube_report': youtube_report,
         'comparison_report': comparison_report,
         'trending_report': trending_report
     }
     
-    # Save the full report
-    json_path = generator.save_report_to_file(full_report, 'full')
-    text_path = generator.save_text_report(full_report, 'full')
+    # Save the JSON and text versions concurrently so text rendering overlaps the JSON write
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        json_future = executor.submit(generator.save_report_to_file, full_report, 'full',
+                                      f"social_media_report_full_{file_timestamp}.json")
+        text_future = executor.submit(generator.save_text_report, full_report, 'full',
+                                      f"social_media_report_full_{file_timestamp}.txt")
+        json_path, text_path = json_future.result(), text_future.result()
     
     print(f"Full report generated:")
     print(f"  JSON: {json_path}")
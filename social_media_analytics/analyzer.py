@@ -1,7 +1,69 @@
 from datetime import datetime, timedelta
 from typing import Dict, List
-import statistics
-from collections import Counter
+import heapq
+from operator import itemgetter
+import numpy as np
+
+
+def _rounded_mean(values: np.ndarray) -> float:
+    """Mean of an array rounded to 2 places, or 0 when it is empty"""
+    return round(float(values.mean()), 2) if values.size else 0
+
+
+def _top_bins(hist: np.ndarray, k: int) -> Dict[int, int]:
+    """The k largest non-empty histogram bins as {bin: count}, highest count first"""
+    order = np.argsort(-hist, kind='stable')[:k]
+    return {int(i): int(hist[i]) for i in order if hist[i]}
+
+
+def _engagement_stats(engagement_scores: np.ndarray) -> Dict:
+    """Summary statistics shared by every platform's engagement analysis"""
+    n = engagement_scores.size
+    return {
+        'total_posts': n,
+        'avg_engagement': _rounded_mean(engagement_scores),
+        'median_engagement': float(np.median(engagement_scores)) if n else 0,
+        'max_engagement': int(engagement_scores.max()) if n else 0,
+        'min_engagement': int(engagement_scores.min()) if n else 0,
+        'std_deviation': round(float(engagement_scores.std(ddof=1)), 2) if n > 1 else 0
+    }
+
+
+def _analyze_twitter(posts: List[Dict]) -> Dict:
+    """Engagement analysis for Twitter posts (likes + 2 * retweets + replies)"""
+    n = len(posts)
+    likes = np.empty(n, dtype=np.int64)
+    retweets = np.empty(n, dtype=np.int64)
+    replies = np.empty(n, dtype=np.int64)
+    for i, post in enumerate(posts):
+        likes[i] = post.get('likes', 0)
+        retweets[i] = post.get('retweets', 0)
+        replies[i] = post.get('replies', 0)
+    
+    analysis = _engagement_stats(likes + (retweets << 1) + replies)
+    analysis.update({
+        'avg_likes': _rounded_mean(likes),
+        'avg_retweets': _rounded_mean(retweets),
+        'avg_replies': _rounded_mean(replies)
+    })
+    return analysis
+
+
+def _analyze_reddit(posts: List[Dict]) -> Dict:
+    """Engagement analysis for Reddit posts (upvotes + comments)"""
+    n = len(posts)
+    upvotes = np.empty(n, dtype=np.int64)
+    comments = np.empty(n, dtype=np.int64)
+    for i, post in enumerate(posts):
+        upvotes[i] = post.get('upvotes', 0)
+        comments[i] = post.get('comments', 0)
+    
+    analysis = _engagement_stats(upvotes + comments)
+    analysis.update({
+        'avg_upvotes': _rounded_mean(upvotes),
+        'avg_comments': _rounded_mean(comments)
+    })
+    return analysis
 
 
 class SocialMediaAnalyzer:
@@ -9,60 +71,44 @@ class SocialMediaAnalyzer:
     Analyzes social media data to extract insights about audience demographics and engagement
     """
     
+    # Platform-specialized engagement analyses, keyed by lowercased platform name
+    _ANALYZERS = {
+        'twitter': _analyze_twitter,
+        'reddit': _analyze_reddit
+    }
+    
     def __init__(self):
-        pass
+        # Results keyed by id(platform_data); the data object is kept alongside so ids cannot be recycled
+        self._engagement_cache = {}
+        self._demo_cache = {}
+    
+    def _ensure_parsed(self, posts: List[Dict]):
+        """Parse each post's timestamp once and cache the datetime on the post as '_dt' (None if unparseable)"""
+        for post in posts:
+            if '_dt' not in post:
+                ts = post.get('timestamp')
+                try:
+                    post['_dt'] = datetime.fromisoformat(ts.replace('Z', '+00:00')) if ts else None
+                except ValueError:
+                    post['_dt'] = None
     
     def analyze_engagement(self, platform_data: Dict) -> Dict:
         """Analyze engagement metrics for a platform"""
         if not platform_data or 'posts' not in platform_data:
             return {}
         
-        posts = platform_data['posts']
-        platform = platform_data['platform'].lower()
-        
-        # Calculate engagement metrics based on platform
-        if platform == 'twitter':
-            likes = [post.get('likes', 0) for post in posts]
-            retweets = [post.get('retweets', 0) for post in posts]
-            replies = [post.get('replies', 0) for post in posts]
-            
-            engagement_scores = [
-                post.get('likes', 0) + (post.get('retweets', 0) * 2) + post.get('replies', 0)
-                for post in posts
-            ]
-            
-        elif platform == 'reddit':
-            upvotes = [post.get('upvotes', 0) for post in posts]
-            downvotes = [post.get('downvotes', 0) for post in posts]
-            comments = [post.get('comments', 0) for post in posts]
-            
-            engagement_scores = [
-                post.get('upvotes', 0) + post.get('comments', 0)
-                for post in posts
-            ]
-        
-        # Calculate statistics
-        analysis = {
-            'total_posts': len(posts),
-            'avg_engagement': round(statistics.mean(engagement_scores), 2) if engagement_scores else 0,
-            'median_engagement': statistics.median(engagement_scores) if engagement_scores else 0,
-            'max_engagement': max(engagement_scores) if engagement_scores else 0,
-            'min_engagement': min(engagement_scores) if engagement_scores else 0,
-            'std_deviation': round(statistics.stdev(engagement_scores), 2) if len(engagement_scores) > 1 else 0
-        }
+        k = id(platform_data)
+        hit = self._engagement_cache.get(k)
+        if hit is not None and hit[0] is platform_data:
+            return hit[1]
         
-        if platform == 'twitter':
-            analysis.update({
-                'avg_likes': round(statistics.mean(likes), 2) if likes else 0,
-                'avg_retweets': round(statistics.mean(retweets), 2) if retweets else 0,
-                'avg_replies': round(statistics.mean(replies), 2) if replies else 0
-            })
-        elif platform == 'reddit':
-            analysis.update({
-                'avg_upvotes': round(statistics.mean(upvotes), 2) if upvotes else 0,
-                'avg_comments': round(statistics.mean(comments), 2) if comments else 0
-            })
+        # Dispatch once to the platform-specialized analysis
+        analyze = self._ANALYZERS.get(platform_data['platform'].lower())
+        if analyze is None:
+            return {}
         
+        analysis = analyze(platform_data['posts'])
+        self._engagement_cache[k] = (platform_data, analysis)
         return analysis
     
     def analyze_audience_demographics(self, platform_data: Dict) -> Dict:
@@ -70,42 +116,53 @@ class SocialMediaAnalyzer:
         if not platform_data or 'posts' not in platform_data:
             return {}
         
+        k = id(platform_data)
+        hit = self._demo_cache.get(k)
+        if hit is not None and hit[0] is platform_data:
+            return hit[1]
+        
         posts = platform_data['posts']
         platform = platform_data['platform'].lower()
+        self._ensure_parsed(posts)
         
-        # Analyze location data if available
-        locations = [post.get('location') for post in posts if post.get('location')]
-        location_counts = Counter(locations)
+        # Tally locations, active hours and hashtags in a single pass over the posts;
+        # strings are encoded to dense integer codes in first-seen order and counted with bincount afterwards
+        location_codes: Dict[str, int] = {}
+        hashtag_codes: Dict[str, int] = {}
+        location_ids = []
+        hashtag_ids = []
+        hour_counts = {}
         
-        # Analyze posting times to infer active hours
-        timestamps = [post.get('timestamp') for post in posts if post.get('timestamp')]
-        hours_active = []
-        
-        for ts in timestamps:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                hours_active.append(dt.hour)
-            except ValueError:
-                continue
-        
-        hour_counts = Counter(hours_active)
-        
-        # Analyze hashtags for topic trends
-        all_hashtags = []
         for post in posts:
-            if 'hashtags' in post and post['hashtags']:
-                all_hashtags.extend(post['hashtags'])
+            location = post.get('location')
+            if location:
+                location_ids.append(location_codes.setdefault(location, len(location_codes)))
+            
+            dt = post['_dt']
+            if dt is not None:
+                hour = dt.hour
+                hour_counts[hour] = hour_counts.get(hour, 0) + 1
+            
+            hashtags = post.get('hashtags')
+            if hashtags:
+                for tag in hashtags:
+                    hashtag_ids.append(hashtag_codes.setdefault(tag, len(hashtag_codes)))
         
-        hashtag_counts = Counter(all_hashtags)
+        location_hist = np.bincount(np.array(location_ids, dtype=np.int32), minlength=len(location_codes))
+        hashtag_hist = np.bincount(np.array(hashtag_ids, dtype=np.int32), minlength=len(hashtag_codes))
+        location_names = list(location_codes)
+        hashtag_names = list(hashtag_codes)
+        peak_hours = heapq.nlargest(5, hour_counts.items(), key=itemgetter(1))
         
         demographics = {
-            'top_locations': dict(location_counts.most_common(5)),
-            'peak_activity_hours': dict(hour_counts.most_common(5)),
-            'top_hashtags': dict(hashtag_counts.most_common(10)),
-            'total_unique_locations': len(location_counts),
-            'most_active_hour': hour_counts.most_common(1)[0][0] if hour_counts else None
+            'top_locations': {location_names[i]: c for i, c in _top_bins(location_hist, 5).items()},
+            'peak_activity_hours': dict(peak_hours),
+            'top_hashtags': {hashtag_names[i]: c for i, c in _top_bins(hashtag_hist, 10).items()},
+            'total_unique_locations': int(np.count_nonzero(location_hist)),
+            'most_active_hour': peak_hours[0][0] if peak_hours else None
         }
         
+        self._demo_cache[k] = (platform_data, demographics)
         return demographics
     
     def compare_platform_performance(self, twitter_data: Dict, reddit_data: Dict) -> Dict:
@@ -204,29 +261,27 @@ class SocialMediaAnalyzer:
             return {}
         
         posts = platform_data['posts']
-        timestamps = [post.get('timestamp') for post in posts if post.get('timestamp')]
-        
-        hours = []
-        days_of_week = []
-        
-        for ts in timestamps:
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                hours.append(dt.hour)
-                days_of_week.append(dt.weekday())  # Monday is 0, Sunday is 6
-            except ValueError:
-                continue
+        self._ensure_parsed(posts)
+        parsed = [post['_dt'] for post in posts if post['_dt'] is not None]
         
-        hour_counts = Counter(hours)
-        day_counts = Counter(days_of_week)
+        # Count posting hours and weekdays (Monday is 0, Sunday is 6) in first-seen order, so ties
+        # break the same way as analyze_audience_demographics' most_active_hour
+        hour_counts = {}
+        day_counts = {}
+        for dt in parsed:
+            hour = dt.hour
+            hour_counts[hour] = hour_counts.get(hour, 0) + 1
+            day = dt.weekday()
+            day_counts[day] = day_counts.get(day, 0) + 1
+        peak_hours = heapq.nlargest(5, hour_counts.items(), key=itemgetter(1))
         
         # Convert day numbers to names
         day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         day_name_counts = {day_names[day]: count for day, count in day_counts.items()}
         
         return {
-            'peak_hours': dict(hour_counts.most_common(5)),
+            'peak_hours': dict(peak_hours),
             'peak_days': day_name_counts,
-            'best_hour_for_posting': hour_counts.most_common(1)[0][0] if hour_counts else None,
-            'best_day_for_posting': day_names[day_counts.most_common(1)[0][0]] if day_counts else None
+            'best_hour_for_posting': peak_hours[0][0] if peak_hours else None,
+            'best_day_for_posting': day_names[max(day_counts, key=day_counts.get)] if day_counts else None
         }
\ No newline at end of file
@@ -2,6 +2,19 @@ import json
 import random
 from datetime import datetime, timedelta
 from typing import Dict, List
+import numpy as np
+
+# Shared generator for the simulated API responses; draws are made per field for a whole batch
+_rng = np.random.default_rng()
+
+_LOCATIONS = ('New York', 'London', 'Tokyo', 'San Francisco', 'Berlin')
+
+
+def _recent_timestamps(count: int) -> List[str]:
+    """ISO timestamps between 0 and 30 days before now, one per post"""
+    now = datetime.now()
+    stamps = [(now - timedelta(days=d)).isoformat() for d in range(31)]
+    return [stamps[d] for d in _rng.integers(0, 31, count).tolist()]
 
 
 class TwitterDataCollector:
@@ -15,21 +28,28 @@ class TwitterDataCollector:
     
     def get_posts_data(self, username: str, count: int = 10) -> List[Dict]:
         """Simulate getting tweet data"""
-        posts = []
-        for i in range(count):
-            post = {
-                'post_id': f'tweet_{random.randint(10000, 99999)}',
+        ids = _rng.integers(10000, 100000, count).tolist()
+        timestamps = _recent_timestamps(count)
+        likes = _rng.integers(0, 1001, count).tolist()
+        retweets = _rng.integers(0, 501, count).tolist()
+        replies = _rng.integers(0, 101, count).tolist()
+        tags = _rng.integers(1, 21, count).tolist()
+        locations = _rng.integers(0, len(_LOCATIONS), count).tolist()
+        
+        return [
+            {
+                'post_id': f'tweet_{ids[i]}',
                 'username': username,
                 'text': f'Sample tweet {i+1} about social media analytics',
-                'timestamp': (datetime.now() - timedelta(days=random.randint(0, 30))).isoformat(),
-                'likes': random.randint(0, 1000),
-                'retweets': random.randint(0, 500),
-                'replies': random.randint(0, 100),
-                'hashtags': [f'#hashtag{random.randint(1, 20)}', f'#socialmedia'],
-                'location': random.choice(['New York', 'London', 'Tokyo', 'San Francisco', 'Berlin'])
+                'timestamp': timestamps[i],
+                'likes': likes[i],
+                'retweets': retweets[i],
+                'replies': replies[i],
+                'hashtags': [f'#hashtag{tags[i]}', f'#socialmedia'],
+                'location': _LOCATIONS[locations[i]]
             }
-            posts.append(post)
-        return posts
+            for i in range(count)
+        ]
     
     def get_user_metrics(self, username: str) -> Dict:
         """Simulate getting user metrics"""
@@ -53,22 +73,29 @@ class RedditDataCollector:
     
     def get_posts_data(self, subreddit: str, count: int = 10) -> List[Dict]:
         """Simulate getting post data from a subreddit"""
-        posts = []
-        for i in range(count):
-            post = {
-                'post_id': f'post_{random.randint(10000, 99999)}',
+        ids = _rng.integers(10000, 100000, count).tolist()
+        timestamps = _recent_timestamps(count)
+        upvotes = _rng.integers(0, 5001, count).tolist()
+        downvotes = _rng.integers(0, 501, count).tolist()
+        comments = _rng.integers(0, 1001, count).tolist()
+        awards = _rng.integers(0, 51, count).tolist()
+        authors = _rng.integers(1000, 10000, count).tolist()
+        
+        return [
+            {
+                'post_id': f'post_{ids[i]}',
                 'subreddit': subreddit,
                 'title': f'Sample post {i+1} about {subreddit}',
                 'body': f'This is the body content of post {i+1}',
-                'timestamp': (datetime.now() - timedelta(days=random.randint(0, 30))).isoformat(),
-                'upvotes': random.randint(0, 5000),
-                'downvotes': random.randint(0, 500),
-                'comments': random.randint(0, 1000),
-                'awards': random.randint(0, 50),
-                'author': f'user_{random.randint(1000, 9999)}'
+                'timestamp': timestamps[i],
+                'upvotes': upvotes[i],
+                'downvotes': downvotes[i],
+                'comments': comments[i],
+                'awards': awards[i],
+                'author': f'user_{authors[i]}'
             }
-            posts.append(post)
-        return posts
+            for i in range(count)
+        ]
     
     def get_community_metrics(self, subreddit: str) -> Dict:
         """Simulate getting subreddit metrics"""
@@ -1,8 +1,58 @@
-import json
 import sqlite3
 from datetime import datetime
 from typing import Dict, List
 import os
+import threading
+
+
+# Schema for the posts table; engagement_score is derived by SQLite from the stored counters
+_POSTS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS posts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        platform TEXT NOT NULL,
+        post_id TEXT UNIQUE NOT NULL,
+        identifier TEXT NOT NULL,
+        content TEXT,
+        timestamp TEXT,
+        likes INTEGER DEFAULT 0,
+        shares INTEGER DEFAULT 0,
+        comments INTEGER DEFAULT 0,
+        engagement_score REAL GENERATED ALWAYS AS (
+            CASE lower(platform)
+                WHEN 'twitter' THEN likes + shares * 2 + comments
+                WHEN 'reddit' THEN shares + comments
+                ELSE 0
+            END
+        ) VIRTUAL,
+        hashtags TEXT,
+        location TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+# Unit recorded for each known metric; anything else is stored as a count
+_UNIT_MAP = {
+    'followers': 'count',
+    'following': 'count',
+    'tweets_count': 'count',
+    'account_age_days': 'days',
+    'engagement_rate': 'percentage',
+    'members': 'count',
+    'active_users': 'count',
+    'posts_per_day': 'count',
+    'avg_comments_per_post': 'count',
+    'community_age_days': 'days'
+}
+
+# Stored (non-generated) post columns, used when migrating an older posts table
+_POSTS_STORED_COLUMNS = (
+    'id, platform, post_id, identifier, content, timestamp, '
+    'likes, shares, comments, hashtags, location, created_at'
+)
+
+
+# Hashtags are stored as one string joined with the ASCII unit separator; str.split(_HASHTAG_SEPARATOR) reads them back
+_HASHTAG_SEPARATOR = '\x1f'
 
 
 class DataStorage:
@@ -11,33 +61,32 @@ class DataStorage:
     Uses SQLite for simplicity, but could be extended to other databases
     """
     
-    def __init__(self, db_path: str = "social_media_data.db"):
+    # Kept apart from the web app's social_media_data.db: this package's posts table derives
+    # engagement_score in SQLite, which the web app's writer cannot insert into
+    def __init__(self, db_path: str = "social_media_analytics.db"):
         self.db_path = db_path
+        # One connection for the lifetime of the storage object instead of one per call
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.row_factory = sqlite3.Row
+        # Writers from different threads share the connection's transaction, so they take turns
+        self._write_lock = threading.Lock()
         self.init_database()
     
+    def close(self):
+        """Close the underlying database connection"""
+        self.conn.close()
+    
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
         # Table for storing post data
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS posts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                platform TEXT NOT NULL,
-                post_id TEXT UNIQUE NOT NULL,
-                identifier TEXT NOT NULL,
-                content TEXT,
-                timestamp TEXT,
-                likes INTEGER DEFAULT 0,
-                shares INTEGER DEFAULT 0,
-                comments INTEGER DEFAULT 0,
-                engagement_score REAL DEFAULT 0.0,
-                hashtags TEXT,
-                location TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        cursor.execute(_POSTS_TABLE_SQL)
+        self._migrate_engagement_column(cursor)
         
         # Table for storing metrics
         cursor.execute('''
@@ -52,131 +101,116 @@ class DataStorage:
             )
         ''')
         
+        # Indexes for the platform filters and the recency ordering used by the readers
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_posts_platform ON posts(platform)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_metrics_platform ON metrics(platform)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_posts_created ON posts(created_at DESC)')
+        
         conn.commit()
-        conn.close()
+    
+    def _migrate_engagement_column(self, cursor):
+        """Rebuild a posts table created before engagement_score became a generated column"""
+        # table_xinfo reports hidden=2 for virtual generated columns
+        columns = {row['name']: row['hidden'] for row in cursor.execute('PRAGMA table_xinfo(posts)')}
+        if columns.get('engagement_score') == 2:
+            return
+        
+        cursor.execute('ALTER TABLE posts RENAME TO posts_legacy')
+        cursor.execute(_POSTS_TABLE_SQL)
+        cursor.execute(
+            f'INSERT INTO posts ({_POSTS_STORED_COLUMNS}) '
+            f'SELECT {_POSTS_STORED_COLUMNS} FROM posts_legacy'
+        )
+        cursor.execute('DROP TABLE posts_legacy')
     
     def store_posts(self, platform_data: Dict):
         """Store collected posts in the database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
         platform = platform_data['platform']
         identifier = platform_data['identifier']
+        # Source fields for the shares/comments columns, chosen once for the whole batch
+        is_twitter = platform.lower() == 'twitter'
+        shares_key, comments_key = ('retweets', 'replies') if is_twitter else ('upvotes', 'comments')
         
+        rows = []
         for post in platform_data['posts']:
-            # Calculate engagement score based on likes, shares, comments
-            engagement_score = 0
-            if platform.lower() == 'twitter':
-                engagement_score = post.get('likes', 0) + (post.get('retweets', 0) * 2) + post.get('replies', 0)
-            elif platform.lower() == 'reddit':
-                engagement_score = post.get('upvotes', 0) + post.get('comments', 0)
-            
-            # Prepare hashtags as JSON string
-            hashtags_str = json.dumps(post.get('hashtags', [])) if post.get('hashtags') else None
+            # Prepare hashtags as a unit-separator joined string
+            tags = post.get('hashtags')
+            hashtags_str = _HASHTAG_SEPARATOR.join(tags) if tags else None
             
+            rows.append((
+                platform,
+                post['post_id'],
+                identifier,
+                post.get('text') or post.get('title'),
+                post['timestamp'],
+                post.get('likes', 0),
+                post.get(shares_key, 0),
+                post.get(comments_key, 0),
+                hashtags_str,
+                post.get('location')
+            ))
+        
+        sql = '''
+            INSERT OR REPLACE INTO posts 
+            (platform, post_id, identifier, content, timestamp, 
+             likes, shares, comments, hashtags, location)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        '''
+        with self._write_lock:
             try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO posts 
-                    (platform, post_id, identifier, content, timestamp, 
-                     likes, shares, comments, engagement_score, hashtags, location)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    platform,
-                    post['post_id'],
-                    identifier,
-                    post.get('text') or post.get('title'),
-                    post['timestamp'],
-                    post.get('likes', 0),
-                    post.get('retweets', 0) if platform.lower() == 'twitter' else post.get('upvotes', 0),
-                    post.get('replies', 0) if platform.lower() == 'twitter' else post.get('comments', 0),
-                    engagement_score,
-                    hashtags_str,
-                    post.get('location')
-                ))
+                cursor.executemany(sql, rows)
             except sqlite3.IntegrityError:
-                # Handle duplicate post_id
-                continue
-        
-        conn.commit()
-        conn.close()
+                # A bad row aborts the batch; retry row by row and skip the offenders
+                conn.rollback()
+                for row in rows:
+                    try:
+                        cursor.execute(sql, row)
+                    except sqlite3.IntegrityError:
+                        continue
+            
+            # Every row above shares the implicit transaction opened by the first insert
+            conn.commit()
     
     def store_metrics(self, platform_data: Dict):
         """Store metrics in the database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
         platform = platform_data['platform']
         identifier = platform_data['identifier']
         metrics = platform_data['metrics']
         
+        rows = []
         for metric_name, metric_value in metrics.items():
             # Determine unit based on metric name
-            unit_map = {
-                'followers': 'count',
-                'following': 'count',
-                'tweets_count': 'count',
-                'account_age_days': 'days',
-                'engagement_rate': 'percentage',
-                'members': 'count',
-                'active_users': 'count',
-                'posts_per_day': 'count',
-                'avg_comments_per_post': 'count',
-                'community_age_days': 'days'
-            }
+            unit = _UNIT_MAP.get(metric_name, 'count')
             
-            unit = unit_map.get(metric_name, 'count')
-            
-            cursor.execute('''
+            rows.append((platform, identifier, metric_name, metric_value, unit))
+        
+        with self._write_lock:
+            cursor.executemany('''
                 INSERT INTO metrics 
                 (platform, identifier, metric_type, value, unit)
                 VALUES (?, ?, ?, ?, ?)
-            ''', (platform, identifier, metric_name, metric_value, unit))
-        
-        conn.commit()
-        conn.close()
+            ''', rows)
+            
+            conn.commit()
     
-    def get_posts_by_platform(self, platform: str) -> List[Dict]:
-        """Retrieve all posts for a specific platform"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM posts WHERE platform = ?', (platform,))
-        rows = cursor.fetchall()
-        
-        columns = [description[0] for description in cursor.description]
-        posts = [dict(zip(columns, row)) for row in rows]
-        
-        conn.close()
-        return posts
+    def get_posts_by_platform(self, platform: str) -> List[sqlite3.Row]:
+        """Get all posts for a specific platform as sqlite3.Row objects (index by column name, or dict(row))"""
+        return self.conn.execute('SELECT * FROM posts WHERE platform = ?', (platform,)).fetchall()
     
-    def get_metrics_by_platform(self, platform: str) -> List[Dict]:
-        """Retrieve all metrics for a specific platform"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM metrics WHERE platform = ?', (platform,))
-        rows = cursor.fetchall()
-        
-        columns = [description[0] for description in cursor.description]
-        metrics = [dict(zip(columns, row)) for row in rows]
-        
-        conn.close()
-        return metrics
+    def get_metrics_by_platform(self, platform: str) -> List[sqlite3.Row]:
+        """Get all metrics for a specific platform as sqlite3.Row objects"""
+        return self.conn.execute('SELECT * FROM metrics WHERE platform = ?', (platform,)).fetchall()
     
-    def get_recent_posts(self, limit: int = 20) -> List[Dict]:
-        """Get most recent posts across all platforms"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+    def get_recent_posts(self, limit: int = 20) -> List[sqlite3.Row]:
+        """Get most recent posts across all platforms as sqlite3.Row objects"""
+        return self.conn.execute('''
             SELECT * FROM posts 
             ORDER BY created_at DESC 
             LIMIT ?
-        ''', (limit,))
-        rows = cursor.fetchall()
-        
-        columns = [description[0] for description in cursor.description]
-        posts = [dict(zip(columns, row)) for row in rows]
-        
-        conn.close()
-        return posts
\ No newline at end of file
+        ''', (limit,)).fetchall()
\ No newline at end of file
@@ -6,6 +6,7 @@ Main script to collect, analyze, and visualize social media data
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from data_collector import collect_platform_data
 from data_storage import DataStorage
@@ -22,29 +23,23 @@ def main():
     visualizer = SocialMediaVisualizer()
     analyzer = SocialMediaAnalyzer()
     
-    # Collect data from Twitter (simulated)
-    print("\nCollecting Twitter data...")
+    # Collect and store Twitter and Reddit data (simulated) concurrently
+    print("\nCollecting Twitter and Reddit data...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        twitter_future = executor.submit(collect_and_store, storage, 'twitter', 'sample_user')
+        reddit_future = executor.submit(collect_and_store, storage, 'reddit', 'technology')
+    
     try:
-        twitter_data = collect_platform_data('twitter', 'sample_user', count=20)
+        twitter_data = twitter_future.result()
         print(f"Collected {len(twitter_data['posts'])} tweets")
-        
-        # Store Twitter data
-        storage.store_posts(twitter_data)
-        storage.store_metrics(twitter_data)
         print("Twitter data stored successfully")
     except Exception as e:
         print(f"Error collecting Twitter data: {e}")
         twitter_data = None
     
-    # Collect data from Reddit (simulated)
-    print("\nCollecting Reddit data...")
     try:
-        reddit_data = collect_platform_data('reddit', 'technology', count=20)
+        reddit_data = reddit_future.result()
         print(f"Collected {len(reddit_data['posts'])} Reddit posts")
-        
-        # Store Reddit data
-        storage.store_posts(reddit_data)
-        storage.store_metrics(reddit_data)
         print("Reddit data stored successfully")
     except Exception as e:
         print(f"Error collecting Reddit data: {e}")
@@ -53,6 +48,7 @@ def main():
     # Perform analysis
     print("\nPerforming analysis...")
     insights = []
+    tw_engagement = rd_engagement = None
     
     if twitter_data:
         print("\nTwitter Engagement Analysis:")
@@ -115,46 +111,67 @@ def main():
     
     # Save results to a report
     print("\nGenerating report...")
-    generate_report(twitter_data, reddit_data, insights)
+    generate_report(twitter_data, reddit_data, insights, tw_engagement, rd_engagement)
+    storage.close()
     
     print("\nAnalytics complete!")
     print("="*50)
 
 
-def generate_report(twitter_data, reddit_data, insights):
-    """Generate a text report with findings"""
-    report_filename = f"social_media_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+def collect_and_store(storage, platform, identifier, count=20):
+    """Collect data for one platform and store its posts and metrics"""
+    platform_data = collect_platform_data(platform, identifier, count=count)
+    storage.store_posts(platform_data)
+    storage.store_metrics(platform_data)
+    return platform_data
+
+
+def generate_report(twitter_data, reddit_data, insights, tw_engagement=None, rd_engagement=None):
+    """Generate a text report with findings, reusing engagement analyses computed by the caller"""
+    if (twitter_data and tw_engagement is None) or (reddit_data and rd_engagement is None):
+        analyzer = SocialMediaAnalyzer()
+        if twitter_data and tw_engagement is None:
+            tw_engagement = analyzer.analyze_engagement(twitter_data)
+        if reddit_data and rd_engagement is None:
+            rd_engagement = analyzer.analyze_engagement(reddit_data)
+    
+    now = datetime.now()
+    report_filename = f"social_media_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+    
+    # Assemble the whole report in memory and write it in one call
+    parts = [
+        "Social Media Analytics Report\n",
+        "="*50 + "\n",
+        f"Generated on: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    ]
+    
+    if twitter_data:
+        parts += [
+            "Twitter Analysis\n",
+            "-"*20 + "\n",
+            f"Posts analyzed: {len(twitter_data['posts'])}\n",
+            f"Average engagement: {tw_engagement.get('avg_engagement', 0)}\n",
+            f"Average likes: {tw_engagement.get('avg_likes', 0)}\n",
+            f"Average retweets: {tw_engagement.get('avg_retweets', 0)}\n",
+            f"Average replies: {tw_engagement.get('avg_replies', 0)}\n\n"
+        ]
+    
+    if reddit_data:
+        parts += [
+            "Reddit Analysis\n",
+            "-"*20 + "\n",
+            f"Posts analyzed: {len(reddit_data['posts'])}\n",
+            f"Average engagement: {rd_engagement.get('avg_engagement', 0)}\n",
+            f"Average upvotes: {rd_engagement.get('avg_upvotes', 0)}\n",
+            f"Average comments: {rd_engagement.get('avg_comments', 0)}\n\n"
+        ]
+    
+    parts.append("Actionable Insights\n")
+    parts.append("-"*20 + "\n")
+    parts += [f"{i}. {insight}\n" for i, insight in enumerate(insights, 1)]
     
     with open(report_filename, 'w', encoding='utf-8') as f:
-        f.write("Social Media Analytics Report\n")
-        f.write("="*50 + "\n")
-        f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        if twitter_data:
-            f.write("Twitter Analysis\n")
-            f.write("-"*20 + "\n")
-            f.write(f"Posts analyzed: {len(twitter_data['posts'])}\n")
-            
-            tw_engagement = SocialMediaAnalyzer().analyze_engagement(twitter_data)
-            f.write(f"Average engagement: {tw_engagement.get('avg_engagement', 0)}\n")
-            f.write(f"Average likes: {tw_engagement.get('avg_likes', 0)}\n")
-            f.write(f"Average retweets: {tw_engagement.get('avg_retweets', 0)}\n")
-            f.write(f"Average replies: {tw_engagement.get('avg_replies', 0)}\n\n")
-        
-        if reddit_data:
-            f.write("Reddit Analysis\n")
-            f.write("-"*20 + "\n")
-            f.write(f"Posts analyzed: {len(reddit_data['posts'])}\n")
-            
-            rd_engagement = SocialMediaAnalyzer().analyze_engagement(reddit_data)
-            f.write(f"Average engagement: {rd_engagement.get('avg_engagement', 0)}\n")
-            f.write(f"Average upvotes: {rd_engagement.get('avg_upvotes', 0)}\n")
-            f.write(f"Average comments: {rd_engagement.get('avg_comments', 0)}\n\n")
-        
-        f.write("Actionable Insights\n")
-        f.write("-"*20 + "\n")
-        for i, insight in enumerate(insights, 1):
-            f.write(f"{i}. {insight}\n")
+        f.write(''.join(parts))
     
     print(f"Report saved to: {report_filename}")
 
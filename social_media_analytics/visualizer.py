@@ -1,7 +1,8 @@
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
-from datetime import datetime
+from itertools import chain
+from types import SimpleNamespace
 from typing import List, Dict
 import numpy as np
 import plotly.graph_objects as go
@@ -13,6 +14,102 @@ plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
 
+# Fields summed into the per-post engagement shown in the charts
+_ENGAGEMENT_FIELDS = {
+    'twitter': ['likes', 'retweets', 'replies'],
+    'reddit': ['upvotes', 'comments']
+}
+
+
+def _posts_frame(posts: List[Dict], fields: List[str]) -> pd.DataFrame:
+    """Columnar (one array per field) view of numeric post fields, with missing values counted as 0"""
+    return pd.DataFrame(posts, columns=fields).fillna(0).astype(np.int64)
+
+
+# Most points a single Plotly trace is given; longer series are downsampled with LTTB
+_MAX_TRACE_POINTS = 2000
+
+
+def _lttb_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices kept by Largest-Triangle-Three-Buckets downsampling of y, using the position as x"""
+    n = y.size
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    y = y.astype(np.float64)
+    x = np.arange(n, dtype=np.float64)
+    # First and last points are always kept; the rest are split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    
+    a = 0
+    for b in range(threshold - 2):
+        start, end = edges[b], edges[b + 1]
+        # The third triangle vertex is the average of the next bucket (or the final point)
+        if b + 2 < threshold - 1:
+            next_start, next_end = edges[b + 1], edges[b + 2]
+            cx, cy = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        
+        area = np.abs((x[a] - cx) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (cy - y[a]))
+        a = start + int(area.argmax())
+        keep[b + 1] = a
+    
+    return keep
+
+
+def _trace_points(x, y) -> tuple:
+    """Cap a trace at _MAX_TRACE_POINTS points while keeping its visual shape"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if y.size <= _MAX_TRACE_POINTS:
+        return x, y
+    keep = _lttb_indices(y, _MAX_TRACE_POINTS)
+    return x[keep], y[keep]
+
+
+def _daily_totals(dates: np.ndarray, engagements: np.ndarray) -> pd.Series:
+    """Per-day engagement totals for a datetime64[D] dates column, oldest day first; at most one point per day"""
+    return pd.Series(engagements).groupby(np.asarray(dates, dtype='datetime64[D]'), sort=True).sum()
+
+
+def _tag_frequencies(tags) -> pd.Series:
+    """Tag counts, most frequent first with ties in first-seen order, counted over factorized integer codes"""
+    # factorize hashes each tag once and numbers the distinct tags in first-seen order
+    codes, uniques = pd.Series(list(tags), dtype=object).factorize()
+    counts = pd.Series(np.bincount(codes, minlength=len(uniques)), index=uniques)
+    return counts.sort_values(ascending=False, kind='stable')
+
+
+def _uniform_histogram(values: np.ndarray, bins: int) -> tuple:
+    """
+    Counts and edges over bins equal-width bins spanning [min, max], as np.histogram returns them.
+    
+    Integer counts (likes, upvotes) are binned with one scaled index per value, corrected against the same
+    float edges np.histogram uses, and counted with a single np.bincount; anything else, and the degenerate
+    single-value case, goes through np.histogram.
+    """
+    values = np.asarray(values)
+    if values.size == 0 or values.dtype.kind not in 'iu':
+        return np.histogram(values, bins=bins)
+    lo, hi = int(values.min()), int(values.max())
+    if lo == hi:
+        return np.histogram(values, bins=bins)
+    
+    edges = np.linspace(lo, hi, bins + 1)
+    values = values.astype(np.float64)
+    indices = ((values - lo) * (bins / (hi - lo))).astype(np.intp)
+    # The maximum lands on index == bins; the last bin is closed like np.histogram's
+    indices[indices == bins] -= 1
+    # Rounding in the scaled index can be one bin off; settle values on a float edge as np.histogram does
+    indices[values < edges[indices]] -= 1
+    indices[(values >= edges[indices + 1]) & (indices != bins - 1)] += 1
+    return np.bincount(indices, minlength=bins), edges
+
+
 class SocialMediaVisualizer:
     """
     Creates visualizations for social media metrics and engagement
@@ -20,43 +117,65 @@ class SocialMediaVisualizer:
     
     def __init__(self):
         self.colors = ['#1DA1F2', '#FF4500', '#3B5998', '#E1306C', '#25D366']  # Social media brand colors
+        # Per-platform chart inputs keyed by (id(platform_data), post count); the data object is kept
+        # alongside so ids cannot be recycled
+        self._agg_cache = {}
+    
+    def _aggregate(self, platform_data: Dict, platform: str) -> SimpleNamespace:
+        """Chart inputs for one platform's posts, computed once per data object and reused by every plot"""
+        posts = platform_data['posts']
+        key = (id(platform_data), len(posts))
+        hit = self._agg_cache.get(key)
+        if hit is not None and hit[0] is platform_data:
+            return hit[1]
+        
+        frame = _posts_frame(posts, _ENGAGEMENT_FIELDS[platform])
+        aggregate = SimpleNamespace(
+            frame=frame,
+            timestamps=pd.to_datetime([p['timestamp'] for p in posts], utc=True, format='ISO8601'),
+            # Date part of each timestamp: truncating to 10 characters leaves YYYY-MM-DD for NumPy to parse
+            dates=np.array([p['timestamp'] for p in posts], dtype='U10').astype('datetime64[D]'),
+            engagements=frame.to_numpy().sum(axis=1),
+            hashtag_counts=_tag_frequencies(chain.from_iterable(p['hashtags'] for p in posts if p.get('hashtags')))
+        )
+        self._agg_cache[key] = (platform_data, aggregate)
+        return aggregate
+    
+    def _plot_distribution(self, ax, values: np.ndarray, color: str, label: str, bins: int = 20):
+        """Draw a histogram as one bar container from counts binned by NumPy"""
+        counts, edges = _uniform_histogram(values, bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, color=color, label=label)
     
     def plot_engagement_comparison(self, twitter_data: Dict, reddit_data: Dict):
         """Plot engagement comparison between Twitter and Reddit"""
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig, axes = plt.subplots(2, 2, figsize=(15, 10), constrained_layout=True)
         fig.suptitle('Social Media Engagement Comparison', fontsize=16)
         
         # Twitter engagement metrics
         if twitter_data and 'posts' in twitter_data:
-            twitter_posts = twitter_data['posts']
-            twitter_likes = [p.get('likes', 0) for p in twitter_posts]
-            twitter_retweets = [p.get('retweets', 0) for p in twitter_posts]
-            twitter_replies = [p.get('replies', 0) for p in twitter_posts]
+            twitter = self._aggregate(twitter_data, 'twitter')
+            twitter_likes = twitter.frame['likes'].to_numpy()
             
             # Twitter likes distribution
-            axes[0, 0].hist(twitter_likes, bins=20, alpha=0.7, color=self.colors[0], label='Likes')
+            self._plot_distribution(axes[0, 0], twitter_likes, self.colors[0], 'Likes')
             axes[0, 0].set_title('Twitter Likes Distribution')
             axes[0, 0].set_xlabel('Number of Likes')
             axes[0, 0].set_ylabel('Frequency')
         
         # Reddit engagement metrics
         if reddit_data and 'posts' in reddit_data:
-            reddit_posts = reddit_data['posts']
-            reddit_upvotes = [p.get('upvotes', 0) for p in reddit_posts]
-            reddit_comments = [p.get('comments', 0) for p in reddit_posts]
+            reddit = self._aggregate(reddit_data, 'reddit')
+            reddit_upvotes = reddit.frame['upvotes'].to_numpy()
             
             # Reddit upvotes distribution
-            axes[0, 1].hist(reddit_upvotes, bins=20, alpha=0.7, color=self.colors[1], label='Upvotes')
+            self._plot_distribution(axes[0, 1], reddit_upvotes, self.colors[1], 'Upvotes')
             axes[0, 1].set_title('Reddit Upvotes Distribution')
             axes[0, 1].set_xlabel('Number of Upvotes')
             axes[0, 1].set_ylabel('Frequency')
         
         # Engagement over time for Twitter
         if twitter_data and 'posts' in twitter_data:
-            dates = [datetime.fromisoformat(p['timestamp'].replace('Z', '+00:00')) for p in twitter_posts]
-            engagements = [p.get('likes', 0) + p.get('retweets', 0) + p.get('replies', 0) for p in twitter_posts]
-            
-            axes[1, 0].scatter(dates, engagements, alpha=0.7, color=self.colors[0])
+            axes[1, 0].scatter(twitter.timestamps, twitter.engagements, alpha=0.7, color=self.colors[0])
             axes[1, 0].set_title('Twitter Engagement Over Time')
             axes[1, 0].set_xlabel('Date')
             axes[1, 0].set_ylabel('Engagement')
@@ -64,21 +183,17 @@ class SocialMediaVisualizer:
         
         # Engagement over time for Reddit
         if reddit_data and 'posts' in reddit_data:
-            dates = [datetime.fromisoformat(p['timestamp'].replace('Z', '+00:00')) for p in reddit_posts]
-            engagements = [p.get('upvotes', 0) + p.get('comments', 0) for p in reddit_posts]
-            
-            axes[1, 1].scatter(dates, engagements, alpha=0.7, color=self.colors[1])
+            axes[1, 1].scatter(reddit.timestamps, reddit.engagements, alpha=0.7, color=self.colors[1])
             axes[1, 1].set_title('Reddit Engagement Over Time')
             axes[1, 1].set_xlabel('Date')
             axes[1, 1].set_ylabel('Engagement')
             axes[1, 1].tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
         plt.show()
     
     def plot_platform_metrics(self, twitter_data: Dict, reddit_data: Dict):
         """Plot key metrics comparison between platforms"""
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
         
         metrics = []
         values = []
@@ -98,29 +213,23 @@ class SocialMediaVisualizer:
         ax.set_ylabel('Count')
         
         # Add value labels on bars
-        for bar, value in zip(bars, values):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{value:,}',
-                   ha='center', va='bottom')
+        ax.bar_label(bars, labels=[f'{value:,}' for value in values], padding=3, fontsize=9)
         
         plt.xticks(rotation=45)
-        plt.tight_layout()
         plt.show()
     
     def plot_engagement_trends(self, twitter_data: Dict, reddit_data: Dict):
-        """Plot engagement trends over time"""
+        """Plot total engagement per day over time"""
         fig = go.Figure()
         
         # Twitter engagement trend
         if twitter_data and 'posts' in twitter_data:
-            tw_posts = twitter_data['posts']
-            dates = [p['timestamp'][:10] for p in tw_posts]  # Extract date part
-            engagements = [p.get('likes', 0) + p.get('retweets', 0) + p.get('replies', 0) for p in tw_posts]
+            twitter = self._aggregate(twitter_data, 'twitter')
+            daily = _daily_totals(twitter.dates, twitter.engagements)
             
-            fig.add_trace(go.Scatter(
-                x=dates,
-                y=engagements,
+            fig.add_trace(go.Scattergl(
+                x=daily.index,
+                y=daily.to_numpy(),
                 mode='lines+markers',
                 name='Twitter Engagement',
                 line=dict(color=self.colors[0])
@@ -128,13 +237,12 @@ class SocialMediaVisualizer:
         
         # Reddit engagement trend
         if reddit_data and 'posts' in reddit_data:
-            rd_posts = reddit_data['posts']
-            dates = [p['timestamp'][:10] for p in rd_posts]  # Extract date part
-            engagements = [p.get('upvotes', 0) + p.get('comments', 0) for p in rd_posts]
+            reddit = self._aggregate(reddit_data, 'reddit')
+            daily = _daily_totals(reddit.dates, reddit.engagements)
             
-            fig.add_trace(go.Scatter(
-                x=dates,
-                y=engagements,
+            fig.add_trace(go.Scattergl(
+                x=daily.index,
+                y=daily.to_numpy(),
                 mode='lines+markers',
                 name='Reddit Engagement',
                 line=dict(color=self.colors[1])
@@ -144,7 +252,8 @@ class SocialMediaVisualizer:
             title='Engagement Trends Over Time',
             xaxis_title='Date',
             yaxis_title='Engagement Score',
-            hovermode='x unified'
+            hovermode='x unified',
+            uirevision='constant'
         )
         
         fig.show()
@@ -154,27 +263,16 @@ class SocialMediaVisualizer:
         if not twitter_data or 'posts' not in twitter_data:
             return
         
-        # Collect all hashtags from tweets
-        all_hashtags = []
-        for post in twitter_data['posts']:
-            if 'hashtags' in post and post['hashtags']:
-                all_hashtags.extend(post['hashtags'])
+        # Top 10 hashtags by frequency across all tweets
+        top = self._aggregate(twitter_data, 'twitter').hashtag_counts.head(10)
         
-        # Count hashtag frequencies
-        hashtag_counts = {}
-        for tag in all_hashtags:
-            hashtag_counts[tag] = hashtag_counts.get(tag, 0) + 1
-        
-        # Sort by frequency
-        sorted_hashtags = sorted(hashtag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        
-        if not sorted_hashtags:
+        if top.empty:
             print("No hashtags found in the data.")
             return
         
-        hashtags, counts = zip(*sorted_hashtags)
+        hashtags, counts = top.index.tolist(), top.to_numpy()
         
-        plt.figure(figsize=(12, 6))
+        plt.figure(figsize=(12, 6), constrained_layout=True)
         bars = plt.bar(hashtags, counts, color=self.colors[0])
         plt.title('Top 10 Hashtags by Frequency')
         plt.xlabel('Hashtags')
@@ -182,11 +280,8 @@ class SocialMediaVisualizer:
         plt.xticks(rotation=45)
         
         # Add value labels on bars
-        for bar, count in zip(bars, counts):
-            plt.text(bar.get_x() + bar.get_width()/2., bar.get_height(),
-                    f'{count}', ha='center', va='bottom')
+        plt.bar_label(bars, labels=[f'{count}' for count in counts], padding=3, fontsize=9)
         
-        plt.tight_layout()
         plt.show()
     
     def create_comprehensive_dashboard(self, twitter_data: Dict, reddit_data: Dict):
@@ -202,23 +297,21 @@ class SocialMediaVisualizer:
         
         # Twitter engagement over time
         if twitter_data and 'posts' in twitter_data:
-            tw_posts = twitter_data['posts']
-            dates = [p['timestamp'][:10] for p in tw_posts]
-            engagements = [p.get('likes', 0) + p.get('retweets', 0) + p.get('replies', 0) for p in tw_posts]
+            twitter = self._aggregate(twitter_data, 'twitter')
+            dates, engagements = _trace_points(twitter.dates, twitter.engagements)
             
             fig.add_trace(
-                go.Scatter(x=dates, y=engagements, mode='lines+markers', name='Twitter', line=dict(color=self.colors[0])),
+                go.Scattergl(x=dates, y=engagements, mode='lines+markers', name='Twitter', line=dict(color=self.colors[0])),
                 row=1, col=1
             )
         
         # Reddit engagement over time
         if reddit_data and 'posts' in reddit_data:
-            rd_posts = reddit_data['posts']
-            dates = [p['timestamp'][:10] for p in rd_posts]
-            engagements = [p.get('upvotes', 0) + p.get('comments', 0) for p in rd_posts]
+            reddit = self._aggregate(reddit_data, 'reddit')
+            dates, engagements = _trace_points(reddit.dates, reddit.engagements)
             
             fig.add_trace(
-                go.Scatter(x=dates, y=engagements, mode='lines+markers', name='Reddit', line=dict(color=self.colors[1])),
+                go.Scattergl(x=dates, y=engagements, mode='lines+markers', name='Reddit', line=dict(color=self.colors[1])),
                 row=1, col=2
             )
         
@@ -235,26 +328,14 @@ class SocialMediaVisualizer:
         
         # Hashtag analysis
         if twitter_data and 'posts' in twitter_data:
-            # Collect hashtags
-            all_hashtags = []
-            for post in twitter_data['posts']:
-                if 'hashtags' in post and post['hashtags']:
-                    all_hashtags.extend(post['hashtags'])
-            
-            # Count frequencies
-            hashtag_counts = {}
-            for tag in all_hashtags:
-                hashtag_counts[tag] = hashtag_counts.get(tag, 0) + 1
-            
             # Top 5 hashtags
-            sorted_hashtags = sorted(hashtag_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+            top = self._aggregate(twitter_data, 'twitter').hashtag_counts.head(5)
             
-            if sorted_hashtags:
-                hashtags, counts = zip(*sorted_hashtags)
+            if not top.empty:
                 fig.add_trace(
-                    go.Bar(x=list(hashtags), y=list(counts), name='Hashtags', marker_color=self.colors[0]),
+                    go.Bar(x=top.index.tolist(), y=top.to_numpy(), name='Hashtags', marker_color=self.colors[0]),
                     row=2, col=2
                 )
         
-        fig.update_layout(height=800, showlegend=True, title_text="Social Media Analytics Dashboard")
+        fig.update_layout(height=800, showlegend=True, title_text="Social Media Analytics Dashboard", uirevision='constant')
         fig.show()
\ No newline at end of file
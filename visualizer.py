@@ -7,7 +7,10 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+import queue
 import threading
+from collections import deque
+from itertools import chain
 import time
 import json
 
@@ -15,6 +18,85 @@ import json
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
+# Real-time engagement weights per platform as (field, weight); other platforms score 0
+_SCORE_WEIGHTS = {
+    'twitter': (('likes', 1.0), ('retweets', 2.0), ('replies', 1.5), ('quotes', 1.5)),
+    'youtube': (('view_count', 0.01), ('like_count', 1.0), ('comment_count', 1.5)),
+}
+
+# Most points kept per live dashboard trace; older points scroll off as new ones arrive
+_REALTIME_MAX_POINTS = 100
+
+# Seconds stop_realtime_visualization waits for the updater thread; covers one 2 s sleep plus a prompt callback
+_UPDATER_JOIN_TIMEOUT = 5
+
+# Put on RealTimeDashboard.inbox to make the consumer thread exit after the batch it is in
+_INBOX_STOP = object()
+
+# One RealTimeDashboard ring-buffer slot: timestamp in nanoseconds since the epoch and engagement score
+_POINT_DTYPE = np.dtype([('ts', 'i8'), ('score', 'f4')])
+
+
+def _score_posts(platform: str, posts: List[Dict]) -> List[float]:
+    """Engagement scores for a batch of one platform's real-time posts"""
+    weights = _SCORE_WEIGHTS.get(platform)
+    if weights is None:
+        return [0] * len(posts)
+
+    fields = [field for field, _ in weights]
+    counts = np.array([[post.get(field, 0) for field in fields] for post in posts],
+                      dtype=np.float64).reshape(len(posts), len(fields))
+    weight_vector = np.array([weight for _, weight in weights])
+    return (counts @ weight_vector).tolist()
+
+
+def _post_columns(posts: List[Dict], fields: List[str]) -> np.ndarray:
+    """One int64 row per field, filled in a single pass over posts with missing values counted as 0"""
+    columns = np.empty((len(fields), len(posts)), dtype=np.int64)
+    for i, post in enumerate(posts):
+        columns[:, i] = [post.get(field, 0) for field in fields]
+    return columns
+
+
+def _post_dates(posts: List[Dict]) -> np.ndarray:
+    """Date part of each post's ISO timestamp as a datetime64[D] array"""
+    # Truncating to 10 characters leaves YYYY-MM-DD, which NumPy parses straight to day precision
+    return np.array([p['timestamp'] for p in posts], dtype='U10').astype('datetime64[D]')
+
+
+def _tag_frequencies(tags) -> pd.Series:
+    """Tag counts, most frequent first with ties in first-seen order, counted over factorized integer codes"""
+    # factorize hashes each tag once and numbers the distinct tags in first-seen order
+    codes, uniques = pd.Series(list(tags), dtype=object).factorize()
+    counts = pd.Series(np.bincount(codes, minlength=len(uniques)), index=uniques)
+    return counts.sort_values(ascending=False, kind='stable')
+
+
+def _uniform_histogram(values: np.ndarray, bins: int) -> tuple:
+    """
+    Counts and edges over bins equal-width bins spanning [min, max], as np.histogram returns them.
+
+    Integer counts (likes, views) are binned with one scaled index per value, corrected against the same
+    float edges np.histogram uses, and counted with a single np.bincount; anything else, and the degenerate
+    single-value case, goes through np.histogram.
+    """
+    values = np.asarray(values)
+    if values.size == 0 or values.dtype.kind not in 'iu':
+        return np.histogram(values, bins=bins)
+    lo, hi = int(values.min()), int(values.max())
+    if lo == hi:
+        return np.histogram(values, bins=bins)
+
+    edges = np.linspace(lo, hi, bins + 1)
+    values = values.astype(np.float64)
+    indices = ((values - lo) * (bins / (hi - lo))).astype(np.intp)
+    # The maximum lands on index == bins; the last bin is closed like np.histogram's
+    indices[indices == bins] -= 1
+    # Rounding in the scaled index can be one bin off; settle values on a float edge as np.histogram does
+    indices[values < edges[indices]] -= 1
+    indices[(values >= edges[indices + 1]) & (indices != bins - 1)] += 1
+    return np.bincount(indices, minlength=bins), edges
+
 
 class SocialMediaVisualizer:
     """
@@ -23,26 +105,48 @@ class SocialMediaVisualizer:
 
     def __init__(self):
         self.colors = ['#1DA1F2', '#FF4500', '#3B5998', '#E1306C', '#25D366']  # Social media brand colors
-        # Store data for real-time updates
-        self.twitter_data_buffer = []
-        self.reddit_data_buffer = []
+        # Store data for real-time updates, keeping only the most recent 100 entries
+        self.twitter_data_buffer = deque(maxlen=100)
+        self.reddit_data_buffer = deque(maxlen=100)
         self.realtime_fig = None
         self.realtime_active = False
+        self._updater_thread = None
+        # Latest points of each live trace by lowercased trace name, as (times, engagements) deques
+        self._trace_windows = {}
+        # Parsed timestamps keyed by (id(platform_data), post count); the data object is kept alongside so ids
+        # cannot be recycled
+        self._timestamp_cache = {}
+
+    def _timestamps(self, platform_data: Dict) -> pd.DatetimeIndex:
+        """Parse a platform's post timestamps in one vectorized call, once per data object"""
+        posts = platform_data['posts']
+        key = (id(platform_data), len(posts))
+        hit = self._timestamp_cache.get(key)
+        if hit is not None and hit[0] is platform_data:
+            return hit[1]
+
+        timestamps = pd.to_datetime([p['timestamp'] for p in posts], utc=True, format='ISO8601')
+        self._timestamp_cache[key] = (platform_data, timestamps)
+        return timestamps
+
+    def _plot_distribution(self, ax, values: np.ndarray, color: str, label: str, bins: int = 20):
+        """Draw a histogram as one bar container from counts binned by NumPy"""
+        counts, edges = _uniform_histogram(values, bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, color=color, label=label)
 
     def plot_engagement_comparison(self, twitter_data: Dict, youtube_data: Dict):
         """Plot engagement comparison between Twitter and YouTube"""
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig, axes = plt.subplots(2, 2, figsize=(15, 10), constrained_layout=True)
         fig.suptitle('Social Media Engagement Comparison', fontsize=16)
 
         # Twitter engagement metrics
         if twitter_data and 'posts' in twitter_data:
             twitter_posts = twitter_data['posts']
-            twitter_likes = [p.get('likes', 0) for p in twitter_posts]
-            twitter_retweets = [p.get('retweets', 0) for p in twitter_posts]
-            twitter_replies = [p.get('replies', 0) for p in twitter_posts]
+            twitter_likes, twitter_retweets, twitter_replies = _post_columns(
+                twitter_posts, ['likes', 'retweets', 'replies'])
 
             # Twitter likes distribution
-            axes[0, 0].hist(twitter_likes, bins=20, alpha=0.7, color=self.colors[0], label='Likes')
+            self._plot_distribution(axes[0, 0], twitter_likes, self.colors[0], 'Likes')
             axes[0, 0].set_title('Twitter Likes Distribution')
             axes[0, 0].set_xlabel('Number of Likes')
             axes[0, 0].set_ylabel('Frequency')
@@ -50,20 +154,19 @@ class SocialMediaVisualizer:
         # YouTube engagement metrics
         if youtube_data and 'posts' in youtube_data:
             youtube_posts = youtube_data['posts']
-            youtube_views = [p.get('views', 0) for p in youtube_posts]
-            youtube_likes = [p.get('likes', 0) for p in youtube_posts]
-            youtube_comments = [p.get('comments', 0) for p in youtube_posts]
+            youtube_views, youtube_likes, youtube_comments = _post_columns(
+                youtube_posts, ['views', 'likes', 'comments'])
 
             # YouTube views distribution
-            axes[0, 1].hist(youtube_views, bins=20, alpha=0.7, color=self.colors[1], label='Views')
+            self._plot_distribution(axes[0, 1], youtube_views, self.colors[1], 'Views')
             axes[0, 1].set_title('YouTube Views Distribution')
             axes[0, 1].set_xlabel('Number of Views')
             axes[0, 1].set_ylabel('Frequency')
 
         # Engagement over time for Twitter
         if twitter_data and 'posts' in twitter_data:
-            dates = [datetime.fromisoformat(p['timestamp'].replace('Z', '+00:00')) for p in twitter_posts]
-            engagements = [p.get('likes', 0) + p.get('retweets', 0) + p.get('replies', 0) for p in twitter_posts]
+            dates = self._timestamps(twitter_data)
+            engagements = twitter_likes + twitter_retweets + twitter_replies
 
             axes[1, 0].scatter(dates, engagements, alpha=0.7, color=self.colors[0])
             axes[1, 0].set_title('Twitter Engagement Over Time')
@@ -73,8 +176,8 @@ class SocialMediaVisualizer:
 
         # Engagement over time for YouTube
         if youtube_data and 'posts' in youtube_data:
-            dates = [datetime.fromisoformat(p['timestamp'].replace('Z', '+00:00')) for p in youtube_posts]
-            engagements = [p.get('likes', 0) + p.get('comments', 0) for p in youtube_posts]
+            dates = self._timestamps(youtube_data)
+            engagements = youtube_likes + youtube_comments
 
             axes[1, 1].scatter(dates, engagements, alpha=0.7, color=self.colors[1])
             axes[1, 1].set_title('YouTube Engagement Over Time')
@@ -82,12 +185,11 @@ class SocialMediaVisualizer:
             axes[1, 1].set_ylabel('Engagement')
             axes[1, 1].tick_params(axis='x', rotation=45)
 
-        plt.tight_layout()
         plt.show()
 
     def plot_platform_metrics(self, twitter_data: Dict, youtube_data: Dict):
         """Plot key metrics comparison between platforms"""
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
 
         metrics = []
         values = []
@@ -107,29 +209,25 @@ class SocialMediaVisualizer:
         ax.set_ylabel('Count')
 
         # Add value labels on bars
-        for bar, value in zip(bars, values):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{value:,}',
-                   ha='center', va='bottom')
+        ax.bar_label(bars, labels=[f'{value:,}' for value in values], padding=3, fontsize=9)
 
         plt.xticks(rotation=45)
-        plt.tight_layout()
         plt.show()
 
     def plot_engagement_trends(self, twitter_data: Dict, youtube_data: Dict):
-        """Plot engagement trends over time"""
+        """Plot total engagement per day over time"""
         fig = go.Figure()
 
         # Twitter engagement trend
         if twitter_data and 'posts' in twitter_data:
             tw_posts = twitter_data['posts']
-            dates = [p['timestamp'][:10] for p in tw_posts]  # Extract date part
-            engagements = [p.get('likes', 0) + p.get('retweets', 0) + p.get('replies', 0) for p in tw_posts]
+            dates = _post_dates(tw_posts)
+            engagements = _post_columns(tw_posts, ['likes', 'retweets', 'replies']).sum(axis=0)
+            daily = pd.Series(engagements, index=dates).groupby(level=0).sum()
 
-            fig.add_trace(go.Scatter(
-                x=dates,
-                y=engagements,
+            fig.add_trace(go.Scattergl(
+                x=daily.index,
+                y=daily.to_numpy(),
                 mode='lines+markers',
                 name='Twitter Engagement',
                 line=dict(color=self.colors[0])
@@ -138,12 +236,13 @@ class SocialMediaVisualizer:
         # YouTube engagement trend
         if youtube_data and 'posts' in youtube_data:
             yt_posts = youtube_data['posts']
-            dates = [p['timestamp'][:10] for p in yt_posts]  # Extract date part
-            engagements = [p.get('likes', 0) + p.get('comments', 0) for p in yt_posts]
+            dates = _post_dates(yt_posts)
+            engagements = _post_columns(yt_posts, ['likes', 'comments']).sum(axis=0)
+            daily = pd.Series(engagements, index=dates).groupby(level=0).sum()
 
-            fig.add_trace(go.Scatter(
-                x=dates,
-                y=engagements,
+            fig.add_trace(go.Scattergl(
+                x=daily.index,
+                y=daily.to_numpy(),
                 mode='lines+markers',
                 name='YouTube Engagement',
                 line=dict(color=self.colors[1])
@@ -153,7 +252,8 @@ class SocialMediaVisualizer:
             title='Engagement Trends Over Time',
             xaxis_title='Date',
             yaxis_title='Engagement Score',
-            hovermode='x unified'
+            hovermode='x unified',
+            uirevision='constant'
         )
 
         fig.show()
@@ -163,27 +263,17 @@ class SocialMediaVisualizer:
         if not twitter_data or 'posts' not in twitter_data:
             return
 
-        # Collect all hashtags from tweets
-        all_hashtags = []
-        for post in twitter_data['posts']:
-            if 'hashtags' in post and post['hashtags']:
-                all_hashtags.extend(post['hashtags'])
-
-        # Count hashtag frequencies
-        hashtag_counts = {}
-        for tag in all_hashtags:
-            hashtag_counts[tag] = hashtag_counts.get(tag, 0) + 1
-
-        # Sort by frequency
-        sorted_hashtags = sorted(hashtag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Top 10 hashtags by frequency across all tweets
+        tags = chain.from_iterable(p['hashtags'] for p in twitter_data['posts'] if p.get('hashtags'))
+        top = _tag_frequencies(tags).head(10)
 
-        if not sorted_hashtags:
+        if top.empty:
             print("No hashtags found in the data.")
             return
 
-        hashtags, counts = zip(*sorted_hashtags)
+        hashtags, counts = top.index.tolist(), top.to_numpy()
 
-        plt.figure(figsize=(12, 6))
+        plt.figure(figsize=(12, 6), constrained_layout=True)
         bars = plt.bar(hashtags, counts, color=self.colors[0])
         plt.title('Top 10 Hashtags by Frequency')
         plt.xlabel('Hashtags')
@@ -191,11 +281,8 @@ class SocialMediaVisualizer:
         plt.xticks(rotation=45)
 
         # Add value labels on bars
-        for bar, count in zip(bars, counts):
-            plt.text(bar.get_x() + bar.get_width()/2., bar.get_height(),
-                    f'{count}', ha='center', va='bottom')
+        plt.bar_label(bars, labels=[f'{count}' for count in counts], padding=3, fontsize=9)
 
-        plt.tight_layout()
         plt.show()
 
     def create_comprehensive_dashboard(self, twitter_data: Dict, youtube_data: Dict):
@@ -212,22 +299,22 @@ class SocialMediaVisualizer:
         # Twitter engagement over time
         if twitter_data and 'posts' in twitter_data:
             tw_posts = twitter_data['posts']
-            dates = [p['timestamp'][:10] for p in tw_posts]
+            dates = _post_dates(tw_posts)
             engagements = [p.get('likes', 0) + p.get('retweets', 0) + p.get('replies', 0) for p in tw_posts]
 
             fig.add_trace(
-                go.Scatter(x=dates, y=engagements, mode='lines+markers', name='Twitter', line=dict(color=self.colors[0])),
+                go.Scattergl(x=dates, y=engagements, mode='lines+markers', name='Twitter', line=dict(color=self.colors[0])),
                 row=1, col=1
             )
 
         # YouTube engagement over time
         if youtube_data and 'posts' in youtube_data:
             yt_posts = youtube_data['posts']
-            dates = [p['timestamp'][:10] for p in yt_posts]
+            dates = _post_dates(yt_posts)
             engagements = [p.get('likes', 0) + p.get('comments', 0) for p in yt_posts]
 
             fig.add_trace(
-                go.Scatter(x=dates, y=engagements, mode='lines+markers', name='YouTube', line=dict(color=self.colors[1])),
+                go.Scattergl(x=dates, y=engagements, mode='lines+markers', name='YouTube', line=dict(color=self.colors[1])),
                 row=1, col=2
             )
 
@@ -244,90 +331,52 @@ class SocialMediaVisualizer:
 
         # Hashtag analysis
         if twitter_data and 'posts' in twitter_data:
-            # Collect hashtags
-            all_hashtags = []
-            for post in twitter_data['posts']:
-                if 'hashtags' in post and post['hashtags']:
-                    all_hashtags.extend(post['hashtags'])
-
-            # Count frequencies
-            hashtag_counts = {}
-            for tag in all_hashtags:
-                hashtag_counts[tag] = hashtag_counts.get(tag, 0) + 1
-
             # Top 5 hashtags
-            sorted_hashtags = sorted(hashtag_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+            tags = chain.from_iterable(p['hashtags'] for p in twitter_data['posts'] if p.get('hashtags'))
+            top = _tag_frequencies(tags).head(5)
 
-            if sorted_hashtags:
-                hashtags, counts = zip(*sorted_hashtags)
+            if not top.empty:
                 fig.add_trace(
-                    go.Bar(x=list(hashtags), y=list(counts), name='Hashtags', marker_color=self.colors[0]),
+                    go.Bar(x=top.index.tolist(), y=top.to_numpy(), name='Hashtags', marker_color=self.colors[0]),
                     row=2, col=2
                 )
 
-        fig.update_layout(height=800, showlegend=True, title_text="Social Media Analytics Dashboard")
+        fig.update_layout(height=800, showlegend=True, title_text="Social Media Analytics Dashboard", uirevision='constant')
         fig.show()
 
-    def start_realtime_visualization(self):
+    def start_realtime_visualization(self, update_callback=None):
         """Start real-time visualization dashboard"""
         print("Starting real-time visualization dashboard...")
-
-        # Create an initial figure for real-time updates
-        self.realtime_fig = go.Figure()
-        self.realtime_fig.update_layout(
-            title='Real-Time Social Media Analytics Dashboard',
-            xaxis_title='Time',
-            yaxis_title='Engagement Score',
-            hovermode='x unified'
-        )
-
-        # Show an empty figure initially
-        self.realtime_fig.show()
-
-        # Update the figure in a separate thread
-        self.realtime_active = True
-        update_thread = threading.Thread(target=self._update_realtime_figures, daemon=True)
-        update_thread.start()
-
+        self.create_realtime_dashboard(update_callback)
         print("Real-time visualization started.")
 
     def stop_realtime_visualization(self):
-        """Stop real-time visualization"""
+        """Stop real-time visualization and wait for the updater thread to exit"""
         self.realtime_active = False
+        thread = self._updater_thread
+        # The update callback may itself call stop, and a thread cannot join itself
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=_UPDATER_JOIN_TIMEOUT)
+        # A thread still stuck in its callback stays recorded so a restart reuses it rather than doubling up
+        if thread is not None and not thread.is_alive():
+            self._updater_thread = None
         print("Real-time visualization stopped.")
 
-    def _update_realtime_figures(self):
-        """Update the real-time figures with new data"""
-        while self.realtime_active:
-            # Update the engagement trends plot with new data
-            self._update_engagement_trends()
-
-            # Sleep for a short time before updating again
-            time.sleep(5)  # Update every 5 seconds
-
-    def _update_engagement_trends(self):
-        """Update the engagement trends with the latest data"""
-        # This would be updated with new data as it comes in
-        # For now, we'll just update the existing figure with mock data
-        pass
-
     def add_realtime_data(self, platform: str, post_data: Dict):
         """Add real-time data to the visualization buffers"""
         # Add data to the appropriate buffer
         if platform.lower() == 'twitter':
             self.twitter_data_buffer.append(post_data)
-            # Keep only the most recent 100 entries
-            if len(self.twitter_data_buffer) > 100:
-                self.twitter_data_buffer = self.twitter_data_buffer[-100:]
         elif platform.lower() == 'reddit':
             self.reddit_data_buffer.append(post_data)
-            # Keep only the most recent 100 entries
-            if len(self.reddit_data_buffer) > 100:
-                self.reddit_data_buffer = self.reddit_data_buffer[-100:]
 
-    def create_realtime_dashboard(self, update_callback=None):
-        """Create a real-time dashboard that can be updated with new data"""
-        # Create a dashboard with subplots for real-time updates
+    def _build_realtime_dashboard(self):
+        """
+        Build the live dashboard figure with its subplot grid and empty traces.
+
+        Returns a go.FigureWidget when ipywidgets is available, so in a notebook in-place trace updates
+        reach the displayed figure; otherwise a plain go.Figure, which show() renders as a snapshot.
+        """
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=('Live Twitter Engagement', 'Live YouTube Engagement',
@@ -340,25 +389,43 @@ class SocialMediaVisualizer:
         fig.update_layout(
             title_text="Real-Time Social Media Analytics Dashboard",
             height=800,
-            showlegend=True
+            showlegend=True,
+            uirevision='constant'
         )
 
         # Initial empty traces for each subplot
-        fig.add_trace(go.Scatter(x=[], y=[], mode='lines+markers', name='Twitter', line=dict(color=self.colors[0])),
+        fig.add_trace(go.Scattergl(x=[], y=[], mode='lines+markers', name='Twitter', line=dict(color=self.colors[0])),
                       row=1, col=1)
-        fig.add_trace(go.Scatter(x=[], y=[], mode='lines+markers', name='Reddit', line=dict(color=self.colors[1])),
+        fig.add_trace(go.Scattergl(x=[], y=[], mode='lines+markers', name='Reddit', line=dict(color=self.colors[1])),
                       row=1, col=2)
         fig.add_trace(go.Bar(x=[], y=[], name='Metrics'), row=2, col=1)
         fig.add_trace(go.Bar(x=[], y=[], name='Hashtags'), row=2, col=2)
 
-        # Show the initial figure
-        fig.show()
+        # A FigureWidget picks up in-place trace assignments without re-sending the whole figure
+        try:
+            return go.FigureWidget(fig)
+        except ImportError:
+            return fig
 
-        # If an update callback is provided, call it periodically
+    def create_realtime_dashboard(self, update_callback=None):
+        """Create a real-time dashboard that can be updated with new data"""
+        # The figure is built and shown once; later calls reuse it instead of opening a new view
+        if self.realtime_fig is None:
+            self.realtime_fig = self._build_realtime_dashboard()
+            self.realtime_fig.show()
+        fig = self.realtime_fig
+
+        # The dashboard counts as live with or without a callback; setting the flag before the liveness
+        # check below also keeps an updater that outlived a timed-out stop running
+        self.realtime_active = True
+
+        # If an update callback is provided, call it periodically from the single updater thread
         if update_callback:
-            update_thread = threading.Thread(target=self._run_update_loop,
-                                           args=(fig, update_callback), daemon=True)
-            update_thread.start()
+            if self._updater_thread and self._updater_thread.is_alive():
+                return fig
+            self._updater_thread = threading.Thread(target=self._run_update_loop,
+                                                    args=(fig, update_callback), daemon=True)
+            self._updater_thread.start()
 
         return fig
 
@@ -375,10 +442,31 @@ class SocialMediaVisualizer:
             time.sleep(2)  # Update every 2 seconds
 
     def _update_dashboard_with_data(self, fig, new_data):
-        """Update the dashboard with new data"""
-        # This would update the dashboard with real-time data
-        # Implementation would depend on the specific data format
-        pass
+        """
+        Append only the new points to the live engagement traces.
+
+        new_data maps a trace name (lowercased, e.g. 'twitter') to {'times': [...], 'engagements': [...]}.
+        Each trace keeps the latest _REALTIME_MAX_POINTS points; the rest of the figure is left untouched.
+
+        plotly.py has no extendTraces counterpart (that exists only in plotly.js), so a trace's data can only
+        change by assigning whole x/y arrays. The window itself is kept in bounded deques that only take the
+        new points; the one unavoidable O(window) step is that assignment, batched into a single update.
+        """
+        if not new_data:
+            return
+
+        with fig.batch_update():
+            for trace in fig.data:
+                name = (trace.name or '').lower()
+                series = new_data.get(name)
+                if not series or not series.get('times'):
+                    continue
+                times, engagements = self._trace_windows.setdefault(
+                    name, (deque(maxlen=_REALTIME_MAX_POINTS), deque(maxlen=_REALTIME_MAX_POINTS)))
+                times.extend(series['times'])
+                engagements.extend(series['engagements'])
+                trace.x = tuple(times)
+                trace.y = tuple(engagements)
 
 
 class RealTimeDashboard:
@@ -387,53 +475,139 @@ class RealTimeDashboard:
     """
     def __init__(self):
         self.visualizer = SocialMediaVisualizer()
-        self.data_points = {'twitter': [], 'reddit': []}
-        self.lock = threading.Lock()
+        # Only the most recent 50 data points are kept per platform, as a ring buffer of (ts, score) records
+        self.data_points = {
+            'twitter': np.zeros(50, dtype=_POINT_DTYPE),
+            'reddit': np.zeros(50, dtype=_POINT_DTYPE),
+            'youtube': np.zeros(50, dtype=_POINT_DTYPE)
+        }
+        # Next slot to overwrite, and how many slots hold real points, per platform
+        self._heads = dict.fromkeys(self.data_points, 0)
+        self._filled = dict.fromkeys(self.data_points, 0)
+        # Held while a batch is written and while a reader copies a window, so both see one consistent state
+        self._points_lock = threading.Lock()
+        # Producers only enqueue scored posts; the single consumer thread is the only writer of data_points.
+        # Producers never lock: they only read _accepting, which is cleared while the dashboard is stopped
+        self.inbox = queue.SimpleQueue()
+        self._accepting = False
+        self._consumer = None
+        self._consumer_lock = threading.Lock()
+        self._start_consumer()
 
     def start_dashboard(self):
         """Start the real-time dashboard"""
+        self._start_consumer()
         self.visualizer.start_realtime_visualization()
 
     def stop_dashboard(self):
-        """Stop the real-time dashboard"""
+        """Stop the real-time dashboard and its inbox consumer; posts arriving afterwards are dropped"""
         self.visualizer.stop_realtime_visualization()
+        with self._consumer_lock:
+            self._accepting = False
+            consumer = self._consumer
+            if consumer is None or not consumer.is_alive():
+                return
+            self.inbox.put(_INBOX_STOP)
+        # Until it exits, the old consumer stays registered so no second writer is started alongside it
+        consumer.join(timeout=_UPDATER_JOIN_TIMEOUT)
+
+    def _start_consumer(self):
+        """Start the inbox consumer thread unless one is already running, and accept posts again"""
+        with self._consumer_lock:
+            if self._consumer is None or not self._consumer.is_alive():
+                # Anything that slipped in behind a stop marker is picked up by the new consumer
+                self._consumer = threading.Thread(target=self._drain_inbox, daemon=True)
+                self._consumer.start()
+            self._accepting = True
 
     def update_with_post(self, post_data):
         """Update the dashboard with a new post"""
         platform = post_data.get('platform', '').lower()
         post = post_data.get('post_data', {})
+        if platform not in self.data_points:
+            raise KeyError(platform)
+
+        # Calculate engagement score; a plain sum beats building a one-row matrix for _score_posts
+        engagement_score = sum(post.get(field, 0) * weight for field, weight in _SCORE_WEIGHTS.get(platform, ()))
+
+        if self._accepting:
+            self.inbox.put((platform, datetime.now().isoformat(), engagement_score))
+
+    def update_with_posts(self, posts_data: List[Dict]):
+        """Update the dashboard with a batch of posts, scoring each platform's posts in one call"""
+        by_platform = {}
+        for post_data in posts_data:
+            by_platform.setdefault(post_data.get('platform', '').lower(), []).append(post_data.get('post_data', {}))
+
+        # Reject the whole batch before anything is enqueued
+        for platform in by_platform:
+            if platform not in self.data_points:
+                raise KeyError(platform)
+        if not self._accepting:
+            return
 
-        # Calculate engagement score
-        if platform == 'twitter':
-            engagement_score = (
-                post.get('likes', 0) +
-                (post.get('retweets', 0) * 2) +
-                (post.get('replies', 0) * 1.5) +
-                (post.get('quotes', 0) * 1.5)
-            )
-        elif platform == 'youtube':
-            engagement_score = (
-                (post.get('view_count', 0) * 0.01) +
-                (post.get('like_count', 0) * 1.0) +
-                (post.get('comment_count', 0) * 1.5)
-            )
-        else:
-            engagement_score = 0
-
-        # Add to data points with timestamp
-        with self.lock:
-            self.data_points[platform].append({
-                'timestamp': datetime.now().isoformat(),
-                'engagement_score': engagement_score,
-                'post_data': post
+        for platform, posts in by_platform.items():
+            scores = _score_posts(platform, posts)
+            timestamp = datetime.now().isoformat()
+            for score in scores:
+                self.inbox.put((platform, timestamp, score))
+
+    def _drain_inbox(self):
+        """Move queued posts into the data points and visualizer buffers, one batch per wake-up"""
+        while True:
+            items = [self.inbox.get()]
+            while True:
+                try:
+                    items.append(self.inbox.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(item is _INBOX_STOP for item in items)
+            # A failing batch is reported and dropped; the consumer keeps draining later ones
+            try:
+                self._apply_batch([item for item in items if item is not _INBOX_STOP])
+            except Exception as e:
+                print(f"Error updating real-time dashboard: {e}")
+            if stop:
+                return
+
+    def _apply_batch(self, items: List[tuple]):
+        """Record (platform, timestamp, score) items in the data points and visualizer buffers"""
+        batches = {}
+        for platform, timestamp, engagement_score in items:
+            timestamps, scores = batches.setdefault(platform, ([], []))
+            timestamps.append(timestamp)
+            scores.append(engagement_score)
+
+            # Add to visualizer buffer
+            self.visualizer.add_realtime_data(platform, {
+                'timestamp': timestamp,
+                'engagement_score': engagement_score
             })
 
-            # Keep only the most recent 50 data points
-            if len(self.data_points[platform]) > 50:
-                self.data_points[platform] = self.data_points[platform][-50:]
-
-        # Add to visualizer buffer
-        self.visualizer.add_realtime_data(platform, {
-            'timestamp': datetime.now().isoformat(),
-            'engagement_score': engagement_score
-        })
\ No newline at end of file
+        for platform, (timestamps, scores) in batches.items():
+            timestamps = np.array(timestamps, dtype='datetime64[ns]')
+            scores = np.array(scores, dtype=np.float32)
+            self._write_points(platform, timestamps, scores)
+
+    def _write_points(self, platform: str, timestamps: np.ndarray, scores: np.ndarray):
+        """Write a batch into the platform's ring buffer, overwriting its oldest slots"""
+        buffer = self.data_points[platform]
+        size = buffer.size
+        timestamps, scores = timestamps[-size:], scores[-size:]
+
+        with self._points_lock:
+            slots = (self._heads[platform] + np.arange(scores.size)) % size
+            buffer['ts'][slots] = timestamps.view('i8')
+            buffer['score'][slots] = scores
+            self._heads[platform] = (self._heads[platform] + scores.size) % size
+            self._filled[platform] = min(self._filled[platform] + scores.size, size)
+
+    def latest_points(self, platform: str) -> tuple:
+        """Timestamps (datetime64[ns]) and float32 scores held in the platform's ring buffer, oldest first"""
+        platform = platform.lower()
+        with self._points_lock:
+            buffer = self.data_points[platform]
+            # np.roll copies, so the window cannot change once the lock is released
+            ordered = np.roll(buffer, -self._heads[platform])[buffer.size - self._filled[platform]:]
+        return ordered['ts'].astype('datetime64[ns]'), ordered['score']